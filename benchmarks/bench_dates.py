@@ -0,0 +1,100 @@
+"""
+Plex date parsing and formatting.
+
+Compares the shared date engine in common.utils with the previous implementations, which are copied below.
+The caches are cleared before every run, so each run starts cold. The outputs of both paths are compared before timing.
+
+Usage:
+    python -m benchmarks.bench_dates [--count 50000] [--distinct 1000] [--tz America/New_York]
+
+Each case runs with mostly distinct values and again with values drawn from --distinct values, like a report column.
+"""
+import argparse
+import random
+import timeit
+from datetime import datetime, timedelta, timezone
+import pytz
+from pmc_automation_tools.api.ux.datasource import UXDatetime
+from pmc_automation_tools.common import utils
+from pmc_automation_tools.common.utils import plex_date_formatter, is_plex_iso_datetime
+
+
+def _previous_formatter(_date, tz):
+    _tz = pytz.timezone(tz)
+    return _tz.localize(_date).astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _previous_dateparse(datestring, tz):
+    standardized_datestring = ' '.join(datestring.split())
+    for f in ("%m/%d/%Y %I:%M:%S %p", "%b %d %Y %I:%M%p"):
+        try:
+            return _previous_formatter(datetime.strptime(standardized_datestring, f), tz)
+        except ValueError:
+            continue
+    return "Invalid Datetime Format"
+
+
+def _previous_xdate(d):
+    try:
+        datetime.strptime(d, '%Y-%m-%dT%H:%M:%S.%fZ')
+        return True
+    except ValueError:
+        return False
+
+
+def _clear_caches():
+    utils._parse_cached.cache_clear()
+    utils._utc_offset.cache_clear()
+    utils._default_date_parser = utils.PlexDateParser()
+
+
+def _sample(count, distinct=None):
+    random.seed(0)
+    start = datetime(2020, 1, 1)
+    pool = [start + timedelta(minutes=random.randrange(0, 5 * 525600)) for _ in range(distinct or count)]
+    dates = pool if distinct is None else [random.choice(pool) for _ in range(count)]
+    report = [d.strftime('%m/%d/%Y %I:%M:%S %p') if i % 2 else d.strftime('%b %d %Y %I:%M%p').replace(' 0', '  ')
+              for i, d in enumerate(dates)]
+    iso = [d.strftime('%Y-%m-%dT%H:%M:%S.000Z') if i % 2 else d.strftime('%Y-%m-%d') for i, d in enumerate(dates)]
+    return dates, report, iso
+
+
+def _time(func, repeat):
+    def run():
+        _clear_caches()
+        func()
+    return min(timeit.repeat(run, number=1, repeat=repeat))
+
+
+def _run(dates, report, iso, tz, repeat):
+    cases = [
+        ('plex_date_formatter', lambda: [_previous_formatter(d, tz) for d in dates], lambda: [plex_date_formatter(d, tz=tz) for d in dates]),
+        ('report date strings', lambda: [_previous_dateparse(s, tz) for s in report], lambda: [UXDatetime(s).datasource_date for s in report]),
+        ('iso detection (_xdate)', lambda: [_previous_xdate(s) for s in iso], lambda: [is_plex_iso_datetime(s) for s in iso]),
+    ]
+    if tz != 'America/New_York':
+        # UXDatetime always formats in the default timezone.
+        cases.pop(1)
+    print(f'{"case":<24}  {"previous":>10}  {"current":>10}')
+    for name, previous, current in cases:
+        _clear_caches()
+        if previous() != current():
+            raise AssertionError(f'{name}: the previous and current results differ.')
+        print(f'{name:<24}  {_time(previous, repeat):>9.3f}s  {_time(current, repeat):>9.3f}s')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=50000)
+    parser.add_argument('--distinct', type=int, default=1000)
+    parser.add_argument('--tz', default='America/New_York')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    for distinct in (None, args.distinct):
+        print(f'{args.count:,} values in {args.tz}, {"mostly distinct" if distinct is None else f"{distinct:,} distinct"}')
+        _run(*_sample(args.count, distinct), args.tz, args.repeat)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Input building cost by row width.
+
+Compares setting N attributes and reading the request query with the lazy query build against the previous
+behavior, which rebuilt the query after every attribute assignment.
+
+Usage:
+    python -m benchmarks.bench_input_building [--widths 10 50 200] [--repeat 200]
+"""
+import argparse
+import timeit
+from pmc_automation_tools.api.ux.datasource import UXDataSourceInput
+from pmc_automation_tools.api.classic.datasource import ClassicDataSourceInput
+
+
+class _EagerUXInput(UXDataSourceInput):
+    # Previous behavior. The query is rebuilt on every public attribute assignment.
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if not name.startswith('_') and self.__refresh_query__:
+            self._update_input_parameters()
+
+
+class _EagerClassicInput(ClassicDataSourceInput):
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if not name.startswith('_') and self.__refresh_query__:
+            self._update_input_parameters()
+
+
+def _build(cls, names, query_attr):
+    def run():
+        query = cls(1234)
+        for name in names:
+            setattr(query, name, 'value')
+        getattr(query, query_attr)
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--widths', type=int, nargs='+', default=[10, 50, 200])
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+    print(f'{"fields":>6}  {"UX eager":>10}  {"UX lazy":>10}  {"Classic eager":>14}  {"Classic lazy":>13}  (microseconds per input)')
+    for width in args.widths:
+        names = [f'Field_{i}' for i in range(width)]
+        results = []
+        for cls, attr in ((_EagerUXInput, '_query_string'), (UXDataSourceInput, '_query_string'),
+                          (_EagerClassicInput, '_parameter_values'), (ClassicDataSourceInput, '_parameter_values')):
+            best = min(timeit.repeat(_build(cls, names, attr), number=args.repeat, repeat=5))
+            results.append(best / args.repeat * 1e6)
+        print(f'{width:>6}  {results[0]:>10.1f}  {results[1]:>10.1f}  {results[2]:>14.1f}  {results[3]:>13.1f}')
+
+
+if __name__ == '__main__':
+    main()
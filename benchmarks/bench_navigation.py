@@ -0,0 +1,61 @@
+"""
+Navigation time with and without the driver performance profile.
+
+Opens a browser for each setting and loads the URLs several times.
+Reports the time driver.get() takes to return, the number of resources the page requested and the bytes transferred.
+
+Plex screens need a logged in session. Pass a profile_dir that already has one, or a page that doesn't need a login.
+Requires a local Edge or Chrome install.
+
+Usage:
+    python -m benchmarks.bench_navigation URL [URL ...] [--driver-type edge] [--repeat 5] [--profile-dir resources/edge_profile]
+"""
+import argparse
+import statistics
+import time
+from pmc_automation_tools.driver.generic import GenericDriver
+
+
+# Resource count and transferred bytes for the current document. Blocked requests are not listed.
+RESOURCE_SCRIPT = '''
+var entries = performance.getEntriesByType('resource'), bytes = 0;
+for (var i = 0; i < entries.length; i++) { bytes += entries[i].transferSize || 0; }
+return [entries.length, bytes];
+'''
+
+
+def _measure(urls, driver_type, repeat, profile_dir, performance_profile):
+    pa = GenericDriver(driver_type, profile_dir=profile_dir, performance_profile=performance_profile)
+    driver = pa.launch('about:blank')
+    results = {url: [] for url in urls}
+    try:
+        for _ in range(repeat):
+            for url in urls:
+                driver.get('about:blank')
+                start = time.perf_counter()
+                driver.get(url)
+                elapsed = time.perf_counter() - start
+                resources, transferred = driver.execute_script(RESOURCE_SCRIPT)
+                results[url].append((elapsed, resources, transferred))
+    finally:
+        driver.quit()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('urls', nargs='+')
+    parser.add_argument('--driver-type', default='edge', choices=['edge', 'chrome'])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--profile-dir', default=None)
+    args = parser.parse_args()
+    print(f'{"profile":<8} {"median get()":>13} {"resources":>10} {"KB":>10}  url')
+    for performance_profile in (False, True):
+        results = _measure(args.urls, args.driver_type, args.repeat, args.profile_dir, performance_profile)
+        for url, runs in results.items():
+            elapsed, resources, transferred = (statistics.median(values) for values in zip(*runs))
+            print(f'{"on" if performance_profile else "off":<8} {elapsed:>12.3f}s {resources:>10.0f} {transferred / 1024:>10.1f}  {url}')
+
+
+if __name__ == '__main__':
+    main()
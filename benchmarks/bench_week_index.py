@@ -0,0 +1,69 @@
+"""
+Week bucketing of demand dates.
+
+Compares common.utils.get_week_index with the per-date get_week_index from the UX data source tools, which is copied below.
+The week index, year offset and group start date of both are compared before timing.
+
+Usage:
+    python -m benchmarks.bench_week_index [--count 1000000]
+"""
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+import numpy as np
+from pmc_automation_tools.common.utils import get_week_index
+
+
+def _previous_week_index(input_date, today, week_start_offset=0):
+    week_start = today - timedelta(days=today.weekday())
+    if isinstance(input_date, (datetime, date)):
+        eval_date = input_date
+    else:
+        try:
+            eval_date = datetime.strptime(input_date, '%Y-%m-%dT%H:%M:%SZ')
+        except ValueError:
+            eval_date = datetime.strptime("1990-01-01T00:00:00Z", '%Y-%m-%dT%H:%M:%SZ')
+    year_offset = date(int(eval_date.strftime("%Y")), 12, 28).isocalendar()[1]
+    week_index = max(
+        -1,
+        int(eval_date.strftime("%W"))
+        - int(week_start.strftime("%W"))
+        + ((int(eval_date.strftime("%Y")) - int(week_start.strftime("%Y"))) * year_offset)
+    )
+    group_start_date = week_start + timedelta(weeks=week_index, days=week_start_offset)
+    return week_index, year_offset, group_start_date
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=1000000)
+    args = parser.parse_args()
+    random.seed(0)
+    today = datetime.combine(date.today(), datetime.min.time())
+    dates = [today + timedelta(days=random.randrange(-60, 400), hours=random.randrange(24)) for _ in range(args.count)]
+    strings = [d.strftime('%Y-%m-%dT%H:%M:%SZ') for d in dates]
+
+    previous, previous_seconds = _timed(lambda: [_previous_week_index(d, today) for d in dates])
+    current, current_seconds = _timed(lambda: get_week_index(dates, today=today))
+    from_strings, string_seconds = _timed(lambda: get_week_index(strings, today=today))
+
+    expected = np.array([p[0] for p in previous]), np.array([p[1] for p in previous]), np.array([p[2] for p in previous], dtype='datetime64[D]')
+    for result in (current, from_strings):
+        if not (np.array_equal(result.week_index, expected[0]) and np.array_equal(result.year_offset, expected[1])
+                and np.array_equal(result.group_start_date, expected[2])):
+            raise AssertionError('The previous and current week indexes differ.')
+    print(f'{args.count:,} dates')
+    print(f'{"per-date loop":<28} {previous_seconds:>8.3f}s')
+    print(f'{"array (datetime objects)":<28} {current_seconds:>8.3f}s')
+    print(f'{"array (Plex ISO strings)":<28} {string_seconds:>8.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -3,8 +3,7 @@ from pmc_automation_tools import (
     ClassicDataSourceInput,
     create_batch_folder,
     setup_logger,
-    read_updated,
-    save_updated
+    RecordLedger
 )
 from pmc_automation_tools.common.exceptions import ClassicConnectionError
 import csv
@@ -13,8 +12,8 @@ import os
 
 batch_folder = create_batch_folder(test=True)
 logger = setup_logger('Supplier Cert',log_file='certs_added.log',root_dir=batch_folder)
-cert_updates_file = os.path.join(batch_folder,'cert_updates.json')
-updated_records = read_updated(cert_updates_file)
+cert_updates_file = os.path.join(batch_folder,'cert_updates.ndjson')
+updated_records = RecordLedger(cert_updates_file)
 
 input_file = 'cert_reference.csv'
 pcn = 'PCN name'
@@ -22,7 +21,7 @@ pcn = 'PCN name'
 wsdl = os.path.join('resources','Plex_SOAP_prod.wsdl')
 pc = ClassicDataSource(auth=pcn,test_db=True,wsdl=wsdl)
 
-with open(input_file,'r',encoding='utf-8-sig') as f:
+with updated_records, open(input_file,'r',encoding='utf-8-sig') as f:
     c = csv.DictReader(f)
     for r in c:
         try:
@@ -45,8 +44,6 @@ with open(input_file,'r',encoding='utf-8-sig') as f:
                 continue
             response = pc.call_data_source(ci)
             logger.info(f'{pcn} - {supplier_code} - {cert_name} - Added')
-            updated_records.append(log_record)
+            updated_records.add(log_record)
         except ClassicConnectionError as e:
-            logger.error(f'{pcn} - {supplier_code} - {cert_name} - Failed to be added - {str(e)}')
-        finally:
-            save_updated(cert_updates_file,updated_records)
\ No newline at end of file
+            logger.error(f'{pcn} - {supplier_code} - {cert_name} - Failed to be added - {str(e)}')
\ No newline at end of file
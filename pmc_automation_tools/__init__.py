@@ -1,21 +1,29 @@
-from pmc_automation_tools.api.ux.datasource import UXDataSource, UXDataSourceInput
-from pmc_automation_tools.api.classic.datasource import ClassicDataSource, ClassicDataSourceInput
-from pmc_automation_tools.api.datasource import ApiDataSource, ApiDataSourceInput
-from pmc_automation_tools.common.utils import debug_logger, create_batch_folder, setup_logger, read_updated, save_updated, chunk_list, plex_date_formatter
-from pmc_automation_tools.driver.ux.driver import UXDriver
-from pmc_automation_tools.driver.classic.driver import ClassicDriver
-from pmc_automation_tools.driver.generic import GenericDriver
-from pmc_automation_tools.driver.common import (
-    VISIBLE,
-    INVISIBLE,
-    CLICKABLE,
-    EXISTS
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pmc_automation_tools.api.common import DataSourceInput
+    from pmc_automation_tools.api.ux.datasource import UXDataSource, UXDataSourceInput, UXSessionDataSource
+    from pmc_automation_tools.api.classic.datasource import ClassicDataSource, ClassicDataSourceInput
+    from pmc_automation_tools.api.datasource import ApiDataSource, ApiDataSourceInput
+    from pmc_automation_tools.common.utils import debug_logger, create_batch_folder, setup_logger, read_updated, save_updated, RecordLedger, chunk_list, plex_date_formatter, parse_plex_datetime
+    from pmc_automation_tools.driver.ux.driver import UXDriver
+    from pmc_automation_tools.driver.classic.driver import ClassicDriver
+    from pmc_automation_tools.driver.generic import GenericDriver
+    from pmc_automation_tools.driver.pool import DriverPool
+    from pmc_automation_tools.driver.common import (
+        VISIBLE,
+        INVISIBLE,
+        CLICKABLE,
+        EXISTS
+    )
 
 __version__ = "0.6.1"
 __all__ = [
+    "DataSourceInput",
     "UXDataSource",
     "UXDataSourceInput",
+    "UXSessionDataSource",
     "ClassicDataSource",
     "ClassicDataSourceInput",
     "ApiDataSource",
@@ -25,6 +33,7 @@ __all__ = [
     "setup_logger",
     "read_updated",
     "save_updated",
+    "RecordLedger",
     "UXDriver",
     "ClassicDriver",
     "VISIBLE",
@@ -32,6 +41,51 @@ __all__ = [
     "CLICKABLE",
     "EXISTS",
     "GenericDriver",
+    "DriverPool",
     "chunk_list",
-    "plex_date_formatter"
-]
\ No newline at end of file
+    "plex_date_formatter",
+    "parse_plex_datetime"
+]
+
+# Modules are imported when one of their attributes is first used.
+# Scripts that only use the data sources don't import selenium, zeep or tkinter.
+_LAZY_ATTRIBUTES = {
+    "DataSourceInput": "pmc_automation_tools.api.common",
+    "UXDataSource": "pmc_automation_tools.api.ux.datasource",
+    "UXDataSourceInput": "pmc_automation_tools.api.ux.datasource",
+    "UXSessionDataSource": "pmc_automation_tools.api.ux.datasource",
+    "ClassicDataSource": "pmc_automation_tools.api.classic.datasource",
+    "ClassicDataSourceInput": "pmc_automation_tools.api.classic.datasource",
+    "ApiDataSource": "pmc_automation_tools.api.datasource",
+    "ApiDataSourceInput": "pmc_automation_tools.api.datasource",
+    "debug_logger": "pmc_automation_tools.common.utils",
+    "create_batch_folder": "pmc_automation_tools.common.utils",
+    "setup_logger": "pmc_automation_tools.common.utils",
+    "read_updated": "pmc_automation_tools.common.utils",
+    "save_updated": "pmc_automation_tools.common.utils",
+    "RecordLedger": "pmc_automation_tools.common.utils",
+    "chunk_list": "pmc_automation_tools.common.utils",
+    "plex_date_formatter": "pmc_automation_tools.common.utils",
+    "parse_plex_datetime": "pmc_automation_tools.common.utils",
+    "UXDriver": "pmc_automation_tools.driver.ux.driver",
+    "ClassicDriver": "pmc_automation_tools.driver.classic.driver",
+    "GenericDriver": "pmc_automation_tools.driver.generic",
+    "DriverPool": "pmc_automation_tools.driver.pool",
+    "VISIBLE": "pmc_automation_tools.driver.common",
+    "INVISIBLE": "pmc_automation_tools.driver.common",
+    "CLICKABLE": "pmc_automation_tools.driver.common",
+    "EXISTS": "pmc_automation_tools.driver.common",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,4 +1,4 @@
-from pmc_automation_tools.api.common import DataSourceInput, DataSourceResponse, DataSource
+from pmc_automation_tools.api.common import DataSourceInput, SlottedDataSourceInput, DataSourceResponse, DataSource, _lazy_query
 from pmc_automation_tools.common.exceptions import ClassicConnectionError
 
 import requests
@@ -15,6 +15,9 @@ SOAP_TEST = 'https://testapi.plexonline.com/Datasource/service.asmx'
 SOAP_PROD = 'https://api.plexonline.com/Datasource/service.asmx'
 class ClassicDataSourceInput(DataSourceInput):
     """Input object that stores the attributes for building the proper request format."""
+    _parameter_names = _lazy_query('_parameter_names')
+    _parameter_values = _lazy_query('_parameter_values')
+
     def __init__(self, data_source_key: int, *args, delimeter='|', **kwargs):
         self._delimeter = delimeter
         super().__init__(data_source_key, *args, type='classic', **kwargs)
@@ -36,6 +39,42 @@ class ClassicDataSourceInput(DataSourceInput):
         self._parameter_values = self._delimeter.join([str(v) for k, v in vars(self).items() if not k.startswith('_')])
 
 
+    @classmethod
+    def input_class(cls, data_source_key: int, parameters: List[str], delimeter: str='|', types: dict=None) -> type:
+        """Generate a dedicated input class for a data source's parameter list.
+
+        The class stores the parameters in __slots__ and converts values on assignment.
+        Instances use less memory than ClassicDataSourceInput objects and can be passed to ClassicDataSource.call_data_source.
+
+        Args:
+            data_source_key (int): data source key
+            parameters (List[str]): data source parameter names
+            delimeter (str, optional): delimeter for the request parameters. Defaults to '|'.
+            types (dict, optional): parameter name:callable pairs to convert values on assignment. Defaults to converting values to str.
+
+        Returns:
+            type: subclass of ClassicSlottedDataSourceInput
+        """
+        types = types or {}
+        converters = {p:types.get(p, str) for p in parameters}
+        return ClassicSlottedDataSourceInput.create_class(f'ClassicDataSourceInput_{data_source_key}', int(data_source_key), parameters, converters, _delimeter=delimeter)
+
+
+class ClassicSlottedDataSourceInput(SlottedDataSourceInput):
+    """Base class for input classes generated by ClassicDataSourceInput.input_class()."""
+    __slots__ = ()
+    _delimeter = '|'
+
+    @property
+    def _parameter_names(self) -> str:
+        return self._delimeter.join(self.to_dict().keys())
+
+
+    @property
+    def _parameter_values(self) -> str:
+        return self._delimeter.join([str(v) for v in self.to_dict().values()])
+
+
 class ClassicDataSource(DataSource):
     def __init__(self, auth: HTTPBasicAuth|str,
                  wsdl,
@@ -101,14 +140,14 @@ class ClassicDataSourceResponse(DataSourceResponse):
             self._format_response()
     
     def __repr__(self):
-        return (f"UXDataSourceResponse(
-                data_source_key={self.__api_id__}, 
-                DataSourceName={self.DataSourceName}, 
-                Message={self.Message}, 
-                Instance={self.InstanceNo}, 
-                StatusNo={self.StatusNo}, 
-                Error={self.Error}, 
-                ErrorNo={self.ErrorNo})")
+        return (f"ClassicDataSourceResponse("
+                f"data_source_key={self.__api_id__}, "
+                f"DataSourceName={self.DataSourceName}, "
+                f"Message={self.Message}, "
+                f"Instance={self.InstanceNo}, "
+                f"StatusNo={self.StatusNo}, "
+                f"Error={self.Error}, "
+                f"ErrorNo={self.ErrorNo})")
 
     def _format_response(self):
         self._transformed_data = []
@@ -3,6 +3,7 @@ import os
 import json
 from requests.auth import HTTPBasicAuth
 from pmc_automation_tools.common.exceptions import PlexResponseError
+from pmc_automation_tools.common.utils import ExcelStreamWriter
 from typing import Literal, Union
 from abc import ABC, abstractmethod
 from requests.adapters import HTTPAdapter
@@ -32,6 +33,7 @@ TYPE_VALUES = ['classic', 'ux', 'api']
 RETRY_COUNT = 10
 BACKOFF = 0.5
 RETRY_STATUSES = [500, 502, 503, 504]
+_UNSET = object()
 
 class CustomSslContextHTTPAdapter(HTTPAdapter):
     """"Transport adapter" that allows us to use a custom ssl context object with the requests."""
@@ -42,12 +44,32 @@ class CustomSslContextHTTPAdapter(HTTPAdapter):
         self.poolmanager = PoolManager(ssl_context=ctx)
 
 
+def _lazy_query(name):
+    """
+    Property for a serialized query attribute.
+
+    The query is only rebuilt with _update_input_parameters() when an input has changed since the last build.
+    """
+    def getter(self):
+        if self.__dict__.get('_dirty', True):
+            self.__dict__['_dirty'] = False
+            self._update_input_parameters()
+        return self.__dict__.get(name)
+
+    def setter(self, value):
+        self.__dict__[name] = value
+    return property(getter, setter)
+
+
 class DataSourceInput(ABC):
     """
     """
+    _query_string = _lazy_query('_query_string')
+
     def __init__(self, api_id: str, type: Literal['classic', 'ux', 'api'], *args, **kwargs):
         self.__api_id__ = str(api_id)
         self.__refresh_query__ = True
+        self._dirty = True
 
         if not type.lower() in TYPE_VALUES:
             raise ValueError(f"{type(self).__name__} type must be one of {TYPE_VALUES}. Received '{type}'.")
@@ -57,14 +79,45 @@ class DataSourceInput(ABC):
         if kwargs.get('json'):
             self.__refresh_query__ = False
             self._query_string = kwargs['json']
-        else:
-            self._update_input_parameters()
+            self._dirty = False
 
 
     def __setattr__(self, name, value):
         self.__dict__[name] = value
         if not name.startswith('_') and self.__refresh_query__:
-            self._update_input_parameters()
+            self.__dict__['_dirty'] = True
+
+
+    @classmethod
+    def from_dict(cls, api_id, inputs: dict, *args, **kwargs) -> 'DataSourceInput':
+        """
+        Create an input object with all attributes from a dictionary in one pass.
+
+        Parameters:
+        - api_id: data source key or url passed to the class constructor.
+        - inputs: dictionary of input name:value pairs. Keys starting with "_" are ignored.
+        - *args, **kwargs: passed to the class constructor. e.g. template_folder, delimeter, method.
+
+        Returns:
+        - DataSourceInput object of the calling class.
+        """
+        query = cls(api_id, *args, **kwargs)
+        query.__dict__.update((k, v) for k, v in inputs.items() if not k.startswith('_'))
+        query._dirty = True
+        return query
+
+
+    def clone(self) -> 'DataSourceInput':
+        """
+        Return a shallow copy of the input object without running the class constructor.
+
+        Attribute values and private bookkeeping such as input types are shared with the original object.
+        """
+        _clone = type(self).__new__(type(self))
+        _clone.__dict__.update(self.__dict__)
+        _clone._dirty = True
+        return _clone
+
 
     @abstractmethod
     def _update_input_parameters(self):...
@@ -87,7 +140,7 @@ class DataSourceInput(ABC):
             if attr.startswith('_'):
                 continue
             vars(self).pop(attr, None)
-        self._update_input_parameters()
+        self._dirty = True
 
 
     def purge_empty(self):
@@ -96,12 +149,128 @@ class DataSourceInput(ABC):
 
         These can cause issues if the input is not nullable.
         """
-        purge_attrs = []
-        for y in vars(self).keys():
-            if getattr(self, y) is None:
-                purge_attrs.append(y)
-        for y in purge_attrs:
-            self.pop_inputs(y)
+        purge_attrs = [k for k, v in vars(self).items() if v is None]
+        self.pop_inputs(*purge_attrs)
+
+class SlottedDataSourceInput():
+    """
+    Base class for generated input classes with a fixed set of input names.
+
+    Inputs are stored in __slots__ instead of an instance dictionary. Values are converted to the expected type on assignment.
+    Unset inputs are not included in the request.
+    """
+    __slots__ = ()
+    __api_id__ = None
+    __fields__ = ()
+    __converters__ = {}
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+
+    def __setattr__(self, name, value):
+        converter = self.__converters__.get(name)
+        if converter is not None and value is not None:
+            value = converter(value)
+        object.__setattr__(self, name, value)
+
+
+    def __repr__(self):
+        _attrs = [f"{k}='{v}'" for k, v in self.to_dict().items()]
+        return f"{type(self).__name__}({', '.join(_attrs)})"
+
+
+    @classmethod
+    def create_class(cls, name: str, api_id, fields, converters: dict=None, **class_attrs) -> type:
+        """
+        Generate a new input class with slots for the provided input names.
+
+        Parameters:
+        - name: class name
+        - api_id: data source key for the class
+        - fields: input names
+        - converters: input name:callable pairs used to convert values on assignment.
+        - class_attrs: any additional class attributes.
+
+        Returns:
+        - new subclass of the calling class
+        """
+        fields = tuple(fields)
+        invalid = [f for f in fields if not f.isidentifier() or f.startswith('_')]
+        if invalid:
+            raise ValueError(f'{cls.__name__} input names must be valid identifiers and not start with "_". Received {invalid}.')
+        namespace = {
+            '__slots__': fields,
+            '__api_id__': api_id,
+            '__fields__': fields,
+            '__converters__': dict(converters or {}),
+            **class_attrs
+        }
+        return type(name, (cls,), namespace)
+
+
+    @classmethod
+    def from_dict(cls, inputs: dict, ignore_unknown: bool=True) -> 'SlottedDataSourceInput':
+        """
+        Create an input object from a dictionary.
+
+        Parameters:
+        - inputs: dictionary of input name:value pairs.
+        - ignore_unknown: skip keys that are not inputs of the class instead of raising AttributeError.
+        """
+        query = cls()
+        for key, value in inputs.items():
+            if ignore_unknown and key not in cls.__fields__:
+                continue
+            setattr(query, key, value)
+        return query
+
+
+    def to_dict(self) -> dict:
+        """
+        Return the inputs that have been set as a dictionary.
+        """
+        _inputs = {}
+        for name in self.__fields__:
+            value = getattr(self, name, _UNSET)
+            if value is not _UNSET:
+                _inputs[name] = value
+        return _inputs
+
+
+    def clone(self) -> 'SlottedDataSourceInput':
+        """
+        Return a copy of the input object.
+        """
+        _clone = type(self).__new__(type(self))
+        for name, value in self.to_dict().items():
+            object.__setattr__(_clone, name, value)
+        return _clone
+
+
+    def pop_inputs(self, *args, **kwargs):
+        """
+        Will unset inputs that are not needed.
+
+        Parameters:
+        - *args: Any specific input name will be removed
+        - **kwargs: Can allow for keeping specific inputs when passed as a list using the "keep" kwarg.
+        """
+        remove = list(args)
+        if 'keep' in kwargs.keys():
+            remove.extend(name for name in self.__fields__ if name not in kwargs['keep'])
+        for name in remove:
+            if name in self.__fields__ and hasattr(self, name):
+                object.__delattr__(self, name)
+
+
+    def purge_empty(self):
+        """
+        Removes any None type inputs from the object.
+        """
+        self.pop_inputs(*[k for k, v in self.to_dict().items() if v is None])
+
 
 class DataSource(ABC):
     def __init__(self, auth: HTTPBasicAuth|str,
@@ -212,6 +381,29 @@ class DataSourceResponse(ABC):
             f.write(json.dumps(self._transformed_data, indent=4))
 
 
+    def save_xlsx(self, out_file:str=None, sheet_name:str='Sheet1', writer:ExcelStreamWriter=None) -> None:
+        """
+        Save the response object to an Excel (.xlsx) file.
+
+        Rows are streamed to the file using openpyxl's write-only mode.
+
+        Parameters:
+
+        - out_file: xlsx file to save. Not used if a writer is provided.
+        - sheet_name: sheet to write the rows to.
+        - writer: ExcelStreamWriter shared between multiple responses. Rows are appended to the sheet and the file is saved when the writer is closed.
+        """
+        if not getattr(self, '_transformed_data', []):
+            raise PlexResponseError(f'{type(self).__name__} has no transformed data to save.')
+        if writer is not None:
+            writer.write(self._transformed_data, sheet_name=sheet_name)
+            return
+        if out_file is None:
+            raise ValueError('An out_file or writer must be provided.')
+        with ExcelStreamWriter(out_file) as writer:
+            writer.write(self._transformed_data, sheet_name=sheet_name)
+
+
     def get_response_attribute(self, attribute:Union[str,tuple[str]], preserve_list=False, **kwargs) -> list | str:
         """
         Extract the attribute from the formatted data in the response.
@@ -1,12 +1,14 @@
 # UX Datasource
-from typing import List
+from typing import List, Dict, Any, Union, Iterable, Iterator, Generator, Callable
 import os
 import json
+import threading
 from datetime import datetime, date, timedelta, timezone
 from warnings import warn
 from requests.auth import HTTPBasicAuth
 from pmc_automation_tools.api.common import (
     DataSourceInput,
+    SlottedDataSourceInput,
     DataSourceResponse,
     DataSource,
     CustomSslContextHTTPAdapter,
@@ -15,12 +17,19 @@ from pmc_automation_tools.api.common import (
     RETRY_STATUSES
     )
 from pmc_automation_tools.common.exceptions import(
-    UXResponseErrorLog
+    UXResponseErrorLog,
+    PlexResponseError
+)
+from pmc_automation_tools.common.utils import (
+    plex_date_formatter,
+    parse_plex_datetime,
+    is_plex_iso_datetime,
+    iter_updated,
+    PLEX_REPORT_FORMATS
 )
-from pmc_automation_tools.common.utils import plex_date_formatter
 import requests
 from urllib3.util.retry import Retry
-from itertools import chain
+from itertools import chain, islice
 from concurrent.futures import ThreadPoolExecutor
 
 class UXDatetime():
@@ -34,17 +43,10 @@ class UXDatetime():
 
 
     def _dateparse(self):
-        formats = ["%m/%d/%Y %I:%M:%S %p", "%b %d %Y %I:%M%p"]
-        # When converting datetime objects to varchars, the format is using spaces for padding rather than zeroes.
-        standardized_datestring = ' '.join(self.datestring.split())
-        for f in formats:
-            try:
-                self.plex_date = datetime.strptime(standardized_datestring, f)
-                return plex_date_formatter(self.plex_date)
-            except:
-                continue
-        self.plex_date = None
-        return "Invalid Datetime Format"
+        self.plex_date = parse_plex_datetime(self.datestring, formats=PLEX_REPORT_FORMATS)
+        if self.plex_date is None:
+            return "Invalid Datetime Format"
+        return plex_date_formatter(self.plex_date)
 
 
     def to_json(self):
@@ -58,19 +60,145 @@ class UXDatetimeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+class UXTemplateRegistry():
+    """
+    Process-wide cache of UX data source templates.
+
+    Each template file is read and parsed once and kept as a prototype UXDataSourceInput with its input types already created.
+    The file is re-read if its modification time changes.
+    """
+    def __init__(self):
+        self._prototypes = {}
+        self._lock = threading.Lock()
+
+
+    def __repr__(self):
+        return f"UXTemplateRegistry(templates={list(self._prototypes.keys())})"
+
+
+    def get(self, template_folder: str, data_source_key: str) -> 'UXDataSourceInput':
+        """
+        Return the prototype input for a data source template.
+
+        Parameters:
+
+        - template_folder: folder containing the json template files.
+        - data_source_key: data source key matching the template file name.
+
+        Returns:
+
+        - UXDataSourceInput prototype or None if there is no template file.
+        """
+        template_path = os.path.join(template_folder, f'{data_source_key}.json')
+        try:
+            mtime = os.stat(template_path).st_mtime_ns
+        except OSError:
+            return None
+        cached = self._prototypes.get(template_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        with self._lock:
+            cached = self._prototypes.get(template_path)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            with open(template_path, 'r', encoding='utf-8') as j:
+                template = json.loads(j.read())
+            if 'inputs' in template.keys():
+                template = template['inputs']
+            prototype = UXDataSourceInput(data_source_key)
+            for key, value in template.items():
+                setattr(prototype, key, value)
+            prototype._type_create()
+            prototype.__template_folder__ = template_folder
+            self._prototypes[template_path] = (mtime, prototype)
+        return prototype
+
+
+    def clear(self):
+        """
+        Remove all cached templates.
+        """
+        with self._lock:
+            self._prototypes.clear()
+
+
+TEMPLATE_REGISTRY = UXTemplateRegistry()
+
+
 class UXDataSourceInput(DataSourceInput):
     def __init__(self, data_source_key: str, *args, template_folder: str=None, **kwargs):
         super().__init__(data_source_key, type='ux', *args, **kwargs)
         self.__input_types__ = {}
         self.__template_folder__ = template_folder
         if self.__template_folder__:
-            template_query = self._query_template_import()
-            if template_query:
-                for key, value in template_query.items():
-                    setattr(self, key, value)
+            prototype = TEMPLATE_REGISTRY.get(self.__template_folder__, self.__api_id__)
+            if prototype:
+                for key, value in vars(prototype).items():
+                    if not key.startswith('_'):
+                        setattr(self, key, value)
+                self.__input_types__.update(prototype.__input_types__)
         self._type_create()
 
 
+    @classmethod
+    def from_template(cls, data_source_key: str, template_folder: str) -> 'UXDataSourceInput':
+        """
+        Create an input by cloning the cached prototype for the data source template.
+
+        Faster than the normal constructor when creating an input per row.
+        The input types dictionary is shared with the prototype.
+
+        Parameters:
+
+        - data_source_key: data source key matching the template file name.
+        - template_folder: folder containing the json template files.
+
+        Returns:
+
+        - UXDataSourceInput object
+        """
+        prototype = TEMPLATE_REGISTRY.get(template_folder, data_source_key)
+        if prototype is None:
+            return cls(data_source_key, template_folder=template_folder)
+        return prototype.clone()
+
+
+    @classmethod
+    def input_class(cls, data_source_key: str, template_folder: str) -> type:
+        """
+        Generate a dedicated input class for a data source template.
+
+        The class stores the template inputs in __slots__ and converts values to the template types on assignment.
+        Instances use less memory than UXDataSourceInput objects and can be passed to UXDataSource.call_data_source.
+
+        Parameters:
+
+        - data_source_key: data source key matching the template file name.
+        - template_folder: folder containing the json template files.
+
+        Returns:
+
+        - subclass of UXSlottedDataSourceInput
+
+        Usage:
+        ::
+
+            PartInput = UXDataSourceInput.input_class(10941, 'ds_templates')
+            u = PartInput(Part_No='123-456', Active='1')
+            r = ux.call_data_source(u)
+        """
+        prototype = TEMPLATE_REGISTRY.get(template_folder, data_source_key)
+        if prototype is None:
+            raise FileNotFoundError(f'No template file found for data source {data_source_key} in {template_folder}.')
+        input_class = prototype.__dict__.get('__input_class__')
+        if input_class is None:
+            converters = {k:_input_converter(v) for k, v in prototype.__input_types__.items()}
+            fields = [k for k in vars(prototype).keys() if not k.startswith('_')]
+            input_class = UXSlottedDataSourceInput.create_class(f'UXDataSourceInput_{prototype.__api_id__}', prototype.__api_id__, fields, converters)
+            prototype.__input_class__ = input_class
+        return input_class
+
+
     def __repr__(self):
         _attrs = [f"{k}='{v}'" for k, v in vars(self).items() if not k.startswith('_')]
         return f"UXDataSourceInput(data_source_key={self.__api_id__}, {', '.join(_attrs)})"
@@ -80,23 +208,13 @@ class UXDataSourceInput(DataSourceInput):
         return '\n'.join([f"{k} : {v}" for k,v in self._query_string.items()])
 
 
-    def _query_template_import(self):
-        for file in os.listdir(self.__template_folder__):
-            if f'{self.__api_id__}.json' == file:
-                with open(os.path.join(self.__template_folder__, file), 'r', encoding='utf-8') as j:
-                    template = json.loads(j.read())
-                if 'inputs' in template.keys():
-                    return template['inputs']
-                return template
-
-
     def _update_input_parameters(self):
         self._query_string = {k:v for k, v in vars(self).items() if not k.startswith('_')}
 
 
     def _type_create(self):
         for k, v in vars(self).items():
-            if not v or k.startswith('_'):
+            if not v or k.startswith('_') or k in self.__input_types__:
                 continue
             value_type = type(v)
             if value_type is int and len(str(v)) == 1:
@@ -123,11 +241,13 @@ class UXDataSourceInput(DataSourceInput):
         """
         return getattr(self, '__input_types__').get(attribute, None)
 
-    def _xstr(self, s):
+    @staticmethod
+    def _xstr(s):
         return str(s or '')
 
 
-    def _xbool(self, b):
+    @staticmethod
+    def _xbool(b):
         if isinstance(b, int):
             return bool(b)
         if isinstance(b, str):
@@ -139,11 +259,7 @@ class UXDataSourceInput(DataSourceInput):
 
 
     def _xdate(self, d):
-        try:
-            datetime.strptime(d, '%Y-%m-%dT%H:%M:%S.%fZ')
-            return True
-        except ValueError:
-            return False
+        return is_plex_iso_datetime(d)
 
 
     def type_reconcile(self):
@@ -192,13 +308,267 @@ class UXDataSourceInput(DataSourceInput):
 
         Additionally removes any attributes not existing in the input_types dictionary.
         """
-        super().purge_empty()
-        purge_attrs = []
-        for y in vars(self).keys():
-            if y not in self.__input_types__.keys() and not y.startswith('_'):
-                purge_attrs.append(y)
-        for y in purge_attrs:
-            self.pop_inputs(y)
+        purge_attrs = [k for k, v in vars(self).items() if v is None or k not in self.__input_types__.keys()]
+        self.pop_inputs(*purge_attrs)
+
+class UXSlottedDataSourceInput(SlottedDataSourceInput):
+    """
+    Base class for input classes generated by UXDataSourceInput.input_class().
+    """
+    __slots__ = ()
+
+    @property
+    def _query_string(self) -> dict:
+        return {k:v.to_json() if isinstance(v, UXDatetime) else v for k, v in self.to_dict().items()}
+
+
+    def __str__(self):
+        return '\n'.join([f"{k} : {v}" for k,v in self._query_string.items()])
+
+
+def _input_converter(target_type: type, serialize: bool=False, memoize: bool=False) -> Callable[[Any], Any]:
+    """
+    Create a function converting a raw value to the expected input type. Follows the same rules as type_reconcile.
+
+    Blank strings for non-string types are converted to None.
+    If memoize is True, datetime values are only parsed once for each distinct value.
+    """
+    if target_type is str:
+        return UXDataSourceInput._xstr
+    if target_type is bool:
+        return UXDataSourceInput._xbool
+    if target_type is UXDatetime:
+        parsed = {}
+        def _convert_date(v):
+            if isinstance(v, UXDatetime):
+                return v.to_json() if serialize else v
+            if isinstance(v, str) and not v.strip():
+                return None
+            if v in parsed:
+                return parsed[v]
+            _date = UXDatetime(v)
+            _date = _date.to_json() if serialize else _date
+            if memoize:
+                parsed[v] = _date
+            return _date
+        return _convert_date
+    def _convert(v):
+        if isinstance(v, str) and not v.strip():
+            return None
+        return target_type(v)
+    return _convert
+
+
+class UXInputBuilder():
+    """
+    Builds many UXDataSourceInput objects at once from tabular data using a data source template.
+
+    One converter is compiled per column from the template input types.
+    Values are converted a column at a time and empty or unknown inputs are dropped in the same pass.
+    """
+    def __init__(self, data_source_key: str, template_folder: str):
+        """
+        Parameters:
+
+        - data_source_key: data source key matching the template file name.
+        - template_folder: folder containing the json template files.
+        """
+        self._prototype = TEMPLATE_REGISTRY.get(template_folder, data_source_key)
+        if self._prototype is None:
+            raise FileNotFoundError(f'No template file found for data source {data_source_key} in {template_folder}.')
+        self._private_attrs = {k:v for k, v in vars(self._prototype).items() if k.startswith('_')}
+
+
+    def __repr__(self):
+        return f"UXInputBuilder(data_source_key={self._prototype.__api_id__}, template_folder={self._prototype.__template_folder__})"
+
+
+    def compile(self, columns: Iterable[str], serialize: bool=False, **kwargs) -> Dict[str, tuple]:
+        """
+        Compile the converters for a set of source columns.
+
+        Parameters:
+
+        - columns: source column names.
+        - serialize: convert datetime values to Plex ISO strings instead of UXDatetime objects.
+        - kwargs: source_column=input_name pairs for columns that do not match the data source input names.
+
+        Returns:
+
+        - dictionary of source column: (input name, converter). Columns without an expected input type are left out.
+        """
+        input_types = self._prototype.__input_types__
+        converters = {}
+        for column in columns:
+            input_name = kwargs.get(column, column)
+            if input_name.startswith('_') or input_name not in input_types:
+                continue
+            converters[column] = (input_name, _input_converter(input_types[input_name], serialize=serialize, memoize=True))
+        return converters
+
+
+    def convert(self, source: Union[str, Iterable[Dict[str, Any]]], sheet_name: str=None, serialize: bool=False, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Convert rows to dictionaries of typed input values.
+
+        Parameters:
+
+        - source: csv/xlsx/xlsm/json/ndjson file path or an iterable of dictionaries.
+        - sheet_name: sheet to read if the source is an Excel file.
+        - serialize: convert datetime values to Plex ISO strings instead of UXDatetime objects.
+        - kwargs: source_column=input_name pairs for columns that do not match the data source input names.
+
+        Returns:
+
+        - list of dictionaries containing only non-empty inputs known to the template.
+
+        Raises:
+
+        - ValueError: a value could not be converted to its input type. The message has the column and row index.
+        """
+        rows = list(self._read(source, sheet_name, **kwargs)) if isinstance(source, str) else list(source)
+        return self._convert_rows(rows, serialize, **kwargs)
+
+
+    def iter_convert(self, source: Union[str, Iterable[Dict[str, Any]]], chunk_size: int=1000, sheet_name: str=None, serialize: bool=False, **kwargs) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        Stream converted rows in chunks so large files are processed in constant memory.
+
+        Parameters:
+
+        - source: csv/xlsx/xlsm/json/ndjson file path or an iterable of dictionaries.
+        - chunk_size: number of rows per chunk.
+        - sheet_name: sheet to read if the source is an Excel file.
+        - serialize: convert datetime values to Plex ISO strings instead of UXDatetime objects.
+        - kwargs: source_column=input_name pairs for columns that do not match the data source input names.
+
+        Yields:
+
+        - list of up to chunk_size dictionaries containing only non-empty inputs known to the template.
+
+        Raises:
+
+        - ValueError: a value could not be converted to its input type. The message has the column and row index.
+        """
+        rows = self._read(source, sheet_name, **kwargs) if isinstance(source, str) else iter(source)
+        converters = {}
+        start = 0
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield self._convert_rows(chunk, serialize, converters, start=start, **kwargs)
+            start += len(chunk)
+
+
+    def _read(self, source: str, sheet_name: str=None, **kwargs) -> Iterator[Dict[str, Any]]:
+        # Only read columns that can map to a template input.
+        columns = set(self._prototype.__input_types__)
+        columns.update(kwargs)
+        return iter_updated(source, columns=columns, sheet_name=sheet_name)
+
+
+    def _convert_rows(self, rows: List[Dict[str, Any]], serialize: bool=False, converters: Dict[str, tuple]=None, start: int=0, **kwargs) -> List[Dict[str, Any]]:
+        if not rows:
+            return []
+        if converters is None:
+            converters = {}
+        columns = dict.fromkeys(k for row in rows for k in row.keys())
+        new_columns = [c for c in columns if c not in converters]
+        if new_columns:
+            converters.update(self.compile(new_columns, serialize=serialize, **kwargs))
+            for column in new_columns:
+                converters.setdefault(column, None)
+        converted_columns = [
+            (converter[0], self._convert_column(rows, column, converter[1], start))
+            for column, converter in converters.items()
+            if converter is not None and column in columns
+        ]
+        converted_rows = [{} for _ in rows]
+        for input_name, values in converted_columns:
+            for converted_row, value in zip(converted_rows, values):
+                if value is not None:
+                    converted_row[input_name] = value
+        return converted_rows
+
+
+    @staticmethod
+    def _convert_column(rows: List[Dict[str, Any]], column: str, converter: Callable[[Any], Any], start: int=0) -> List[Any]:
+        try:
+            return list(map(lambda v: None if v is None else converter(v), (row.get(column) for row in rows)))
+        except (ValueError, TypeError):
+            pass
+        # Convert the values one at a time to report the row that failed.
+        values = []
+        for index, row in enumerate(rows, start):
+            value = row.get(column)
+            try:
+                values.append(None if value is None else converter(value))
+            except (ValueError, TypeError) as e:
+                raise ValueError(f'Unable to convert column {column!r} at row {index} with value {value!r}. {e}') from e
+        return values
+
+
+    def _to_input(self, values: Dict[str, Any]) -> 'UXDataSourceInput':
+        query = UXDataSourceInput.__new__(UXDataSourceInput)
+        query.__dict__.update(self._private_attrs)
+        query.__dict__.update(values)
+        query._dirty = True
+        return query
+
+
+    def build(self, source: Union[str, Iterable[Dict[str, Any]]], sheet_name: str=None, **kwargs) -> List['UXDataSourceInput']:
+        """
+        Build ready to call UXDataSourceInput objects.
+
+        Parameters:
+
+        - source: csv/xlsx/xlsm/json/ndjson file path or an iterable of dictionaries.
+        - sheet_name: sheet to read if the source is an Excel file.
+        - kwargs: source_column=input_name pairs for columns that do not match the data source input names.
+
+        Returns:
+
+        - list of UXDataSourceInput objects.
+        """
+        return [self._to_input(values) for values in self.convert(source, sheet_name=sheet_name, **kwargs)]
+
+
+    def iter_build(self, source: Union[str, Iterable[Dict[str, Any]]], chunk_size: int=1000, sheet_name: str=None, **kwargs) -> Generator[List['UXDataSourceInput'], None, None]:
+        """
+        Stream ready to call UXDataSourceInput objects in chunks.
+
+        Parameters:
+
+        - source: csv/xlsx/xlsm/json/ndjson file path or an iterable of dictionaries.
+        - chunk_size: number of inputs per chunk.
+        - sheet_name: sheet to read if the source is an Excel file.
+        - kwargs: source_column=input_name pairs for columns that do not match the data source input names.
+
+        Yields:
+
+        - list of up to chunk_size UXDataSourceInput objects.
+        """
+        for chunk in self.iter_convert(source, chunk_size=chunk_size, sheet_name=sheet_name, **kwargs):
+            yield [self._to_input(values) for values in chunk]
+
+
+    def build_bodies(self, source: Union[str, Iterable[Dict[str, Any]]], sheet_name: str=None, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Build serialized request bodies that can be posted directly as json.
+
+        Parameters:
+
+        - source: csv/xlsx/xlsm/json/ndjson file path or an iterable of dictionaries.
+        - sheet_name: sheet to read if the source is an Excel file.
+        - kwargs: source_column=input_name pairs for columns that do not match the data source input names.
+
+        Returns:
+
+        - list of dictionaries.
+        """
+        return self.convert(source, sheet_name=sheet_name, serialize=True, **kwargs)
+
 
 class UXDataSource(DataSource):
     def __init__(self, auth: HTTPBasicAuth | str,
@@ -289,6 +659,97 @@ class UXDataSource(DataSource):
         all_datasources = list(chain.from_iterable(access_list))
         return UXDataSourceResponse('access_list', rows=all_datasources)
 
+class UXSessionDataSource(UXDataSource):
+    def __init__(self, driver, headers: dict=None):
+        """
+        Call UX data sources with the session of a logged in UXDriver instead of web service credentials.
+
+        Requests are sent over HTTP with the browser's cookies and session token. The browser is not used for the calls.
+
+        Parameters:
+
+        - driver: UXDriver that has already logged in.
+        - headers: dict, optional
+            - Additional request headers.
+        """
+        self._driver = driver
+        self._headers = headers or {}
+        self._session = None
+        super().__init__(auth=None, test_db=driver.test_db)
+        self.refresh()
+
+
+    def __repr__(self):
+        return f"UXSessionDataSource(url_comb={self.url_comb}, test_db={self._test_db})"
+
+
+    def set_auth(self, key):
+        """
+        The browser session cookies are used for authentication. No credentials are looked up.
+        """
+        return None
+
+
+    def refresh(self):
+        """
+        Copy the current cookies and session token from the driver.
+
+        Call after switching PCNs or logging in again with the driver.
+        """
+        self.token = self._driver.token_get()
+        self.url_comb = self._driver.url_comb
+        self._session = self._create_session()
+
+
+    def _create_session(self):
+        session = super()._create_session()
+        for cookie in self._driver.driver.get_cookies():
+            session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'), path=cookie.get('path', '/'))
+        session.headers['User-Agent'] = self._driver.driver.execute_script('return navigator.userAgent;')
+        session.headers.update(self._headers)
+        return session
+
+
+    def _request(self, method: str, url: str, **kwargs):
+        response = self._session.request(method, url, allow_redirects=False, **kwargs)
+        # Expired sessions are redirected to the sign on page.
+        if response.is_redirect or response.status_code in (401, 403):
+            raise PlexResponseError(f'The browser session is not authorized for {url}. Log in again and call refresh().', status_code=response.status_code)
+        return response
+
+
+    def call_data_source(self, query:UXDataSourceInput) -> 'UXDataSourceResponse':
+        """
+        Call the UX data source with the browser session.
+
+        Parameters:
+
+        - query: UXDataSourceInput object
+
+        Returns:
+
+        - UXDataSourceResponse object
+        """
+        json_query = json.loads(json.dumps(query._query_string, cls=UXDatetimeEncoder))
+        url = f'{self.url_comb}/api/datasources/{query.__api_id__}/execute?format=2&{self.token}'
+        response = self._request('POST', url, json=json_query)
+        json_data = response.json()
+        return UXDataSourceResponse(query.__api_id__, **json_data)
+
+
+    def list_data_source_access(self) -> 'UXDataSourceResponse':
+        """
+        Get a list of data sources that are enabled for the browser session.
+
+        Returns:
+
+        - UXDataSourceResponse object
+        """
+        url = f'{self.url_comb}/api/datasources/search?name=&{self.token}'
+        response = self._request('GET', url)
+        return UXDataSourceResponse('access_list', rows=response.json())
+
+
 class UXDataSourceResponse(DataSourceResponse):
     def __init__(self, data_source_key, **kwargs):
         super().__init__(data_source_key, **kwargs)
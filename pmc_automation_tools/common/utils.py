@@ -1,15 +1,23 @@
-from datetime import datetime, date, timedelta, timezone
-import pytz
+from datetime import datetime, date, time, timedelta, timezone
 import os
 import sys
 import json
 import csv
 from warnings import warn
+import re
+import sqlite3
+import threading
 import logging
-from logging.handlers import MemoryHandler
+import atexit
+import queue
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+from functools import lru_cache
+from time import monotonic
 
-from typing import Union, Generator, List, Dict, Any
-from openpyxl import load_workbook
+from typing import Union, Generator, List, Dict, Any, Optional, Tuple, Iterable, NamedTuple
+
+# numpy, openpyxl and pytz are imported when first used to keep the package import light.
+np = None
 
 DEFAULT_FORMATTER = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 STDOUT_FORMATTER = "[%(asctime)s][%(filename)s:%(lineno)s][%(funcName)20s()] %(message)s"
@@ -17,6 +25,11 @@ LOG_FORMATS = {
     "DAILY": "%Y_%m_%d_",
     "MONTHLY": "%Y_%m_"
     }
+PLEX_ISO_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+PLEX_ISO_MS_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+PLEX_REPORT_FORMATS = ("%m/%d/%Y %I:%M:%S %p", "%b %d %Y %I:%M%p")
+PLEX_DATE_FORMATS = PLEX_REPORT_FORMATS + (PLEX_ISO_MS_FORMAT, PLEX_ISO_FORMAT)
+_MONTHS = {m: i for i, m in enumerate(['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC'], 1)}
 
 def debug_logger(level=logging.NOTSET):
     logger = logging.getLogger(__name__)
@@ -91,6 +104,58 @@ def create_batch_folder(root:str='', batch_code:str=None, include_time:bool=Fals
     return batch_folder
 
 
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formats log records as one json object per line.
+    """
+    def format(self, record:logging.LogRecord) -> str:
+        entry = {
+            'time': self.formatTime(record, self.datefmt),
+            'name': record.name,
+            'level': record.levelname,
+            'message': record.getMessage(),
+            'file': record.filename,
+            'line': record.lineno,
+            'function': record.funcName,
+            'thread': record.threadName,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class _LightQueueHandler(QueueHandler):
+    """
+    QueueHandler that only merges the message arguments before enqueueing.
+
+    The default prepare() runs the full formatter in the logging thread. Formatting is left to the listener's handlers instead.
+    """
+    _exc_formatter = logging.Formatter()
+
+    def prepare(self, record:logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self._exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_QUEUE_LISTENERS = []
+
+
+@atexit.register
+def _stop_queue_listeners() -> None:
+    while _QUEUE_LISTENERS:
+        listener = _QUEUE_LISTENERS.pop()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+            handler.close()
+
+
 def setup_logger(name:str,
                  log_file:str='log.log',
                  file_format:str='DAILY',
@@ -98,7 +163,11 @@ def setup_logger(name:str,
                  formatter:str=DEFAULT_FORMATTER,
                  root_dir:str=None,
                  flush_level:Union[int, str]=logging.ERROR,
-                 write_stdout:bool=True) -> logging.Logger:
+                 write_stdout:bool=True,
+                 use_queue:bool=False,
+                 json_lines:bool=False,
+                 max_bytes:int=0,
+                 backup_count:int=5) -> logging.Logger:
     """
     Setup a logger with a memory buffer that flushes on errors, and optionally outputs to stdout.
 
@@ -111,6 +180,10 @@ def setup_logger(name:str,
     - root_dir: root directory to store the log file.
     - flush_level: log level to trigger flushing to the file.
     - write_stdout: if True, logs will also be printed to stdout.
+    - use_queue: if True, records are put on a queue and written by a background listener thread.
+    - json_lines: if True, the log file is written as one json object per line.
+    - max_bytes: rotate the log file when it reaches this size. 0 disables rotation.
+    - backup_count: number of rotated log files to keep.
 
     Default formatter: %(asctime)s - %(name)s - %(levelname)s - %(message)s
     """
@@ -118,8 +191,11 @@ def setup_logger(name:str,
     log_date = datetime.now().strftime(date_format) if date_format else ""
     log_path = os.path.join(root_dir, log_date + log_file) if root_dir else log_date + log_file
 
-    file_handler = logging.FileHandler(log_path, mode='a', encoding='utf-8')
-    file_handler.setFormatter(logging.Formatter(formatter))
+    if max_bytes:
+        file_handler = RotatingFileHandler(log_path, mode='a', maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+    else:
+        file_handler = logging.FileHandler(log_path, mode='a', encoding='utf-8')
+    file_handler.setFormatter(JsonLinesFormatter() if json_lines else logging.Formatter(formatter))
 
     memory_handler = MemoryHandler(
         capacity=1024,
@@ -131,15 +207,183 @@ def setup_logger(name:str,
     logger.setLevel(level)
     
     if not logger.hasHandlers():
-        logger.addHandler(memory_handler)
+        handlers = [memory_handler]
         if write_stdout:
             stream_handler = logging.StreamHandler()
             stream_handler.setFormatter(logging.Formatter(STDOUT_FORMATTER))
             stream_handler.setLevel(level)
-            logger.addHandler(stream_handler)
+            handlers.append(stream_handler)
+        if use_queue:
+            log_queue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            _QUEUE_LISTENERS.append(listener)
+            logger.addHandler(_LightQueueHandler(log_queue))
+        else:
+            for handler in handlers:
+                logger.addHandler(handler)
     return logger
 
-def read_updated(in_file:str, obj_type:Union[dict, list]=None, sheet_name:str=None) -> Union[List[Dict[str, str]],Any]: 
+_LOG_EVERY = {}
+_LOG_SAMPLED = {}
+# Guards the rate limit state so threads sharing a call site agree on which message is logged.
+_LOG_LIMIT_LOCK = threading.Lock()
+
+
+def log_every(logger:logging.Logger, level:int, msg:str, *args, interval:float=10.0, key:Any=None, **kwargs) -> bool:
+    """
+    Log a message at most once per interval for each call site.
+
+    The number of suppressed messages is added to the next message that is logged.
+
+    Parameters:
+    - logger: logger to use.
+    - level: log level for the message.
+    - msg: log message. Formatted with args like the logging methods.
+    - interval: minimum number of seconds between messages.
+    - key: rate limit key. Defaults to the calling line.
+    - kwargs: passed to logger.log. e.g. exc_info
+
+    Returns:
+    - True if the message was logged.
+    """
+    if not logger.isEnabledFor(level):
+        return False
+    if key is None:
+        frame = sys._getframe(1)
+        key = (frame.f_code, frame.f_lineno)
+    with _LOG_LIMIT_LOCK:
+        now = monotonic()
+        state = _LOG_EVERY.get(key)
+        if state is not None and now - state[0] < interval:
+            state[1] += 1
+            return False
+        suppressed = state[1] if state is not None else 0
+        _LOG_EVERY[key] = [now, 0]
+    if suppressed:
+        msg = f'{msg} ({suppressed:,} similar messages suppressed)'
+    logger.log(level, msg, *args, stacklevel=2, **kwargs)
+    return True
+
+
+def log_sampled(logger:logging.Logger, level:int, msg:str, *args, n:int=100, key:Any=None, **kwargs) -> bool:
+    """
+    Log 1 in every n messages for each call site, starting with the first.
+
+    Parameters:
+    - logger: logger to use.
+    - level: log level for the message.
+    - msg: log message. Formatted with args like the logging methods.
+    - n: sample rate.
+    - key: sample key. Defaults to the calling line.
+    - kwargs: passed to logger.log. e.g. exc_info
+
+    Returns:
+    - True if the message was logged.
+    """
+    if not logger.isEnabledFor(level):
+        return False
+    if key is None:
+        frame = sys._getframe(1)
+        key = (frame.f_code, frame.f_lineno)
+    with _LOG_LIMIT_LOCK:
+        count = _LOG_SAMPLED.get(key, 0)
+        _LOG_SAMPLED[key] = count + 1
+    if count % n:
+        return False
+    logger.log(level, msg, *args, stacklevel=2, **kwargs)
+    return True
+
+
+class LogSummary():
+    """
+    Counts events and logs an aggregated summary at a fixed interval instead of a line per event.
+
+    Summaries are checked when events are added, so no background thread is used.
+    Any remaining counts are logged when flushed or when used as a context manager.
+
+    Usage:
+    ::
+
+        with LogSummary(logger, interval=10) as summary:
+            for r in rows:
+                ...
+                summary.add('rows updated')
+        # INFO - 1,234 rows updated in the last 10s
+    """
+    def __init__(self, logger:logging.Logger, interval:float=10.0, level:int=logging.INFO, template:str='{count:,} {event} in the last {elapsed:.1f}s'):
+        """
+        Parameters:
+        - logger: logger to use.
+        - interval: seconds between summaries.
+        - level: log level for the summaries.
+        - template: summary message format. Receives count, event and elapsed.
+        """
+        self.logger = logger
+        self.interval = interval
+        self.level = level
+        self.template = template
+        self._counts = {}
+        self._totals = {}
+        self._lock = threading.Lock()
+        self._start = monotonic()
+
+
+    def __repr__(self):
+        return f"LogSummary(interval={self.interval}, totals={self._totals})"
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.flush()
+
+
+    @property
+    def totals(self) -> Dict[str, int]:
+        """
+        Event counts since the summary was created.
+        """
+        return dict(self._totals)
+
+
+    def add(self, event:str, count:int=1) -> None:
+        """
+        Count an event. Logs the summary if the interval has elapsed.
+
+        Parameters:
+        - event: event description used in the summary message.
+        - count: number of events to add.
+        """
+        with self._lock:
+            self._counts[event] = self._counts.get(event, 0) + count
+            self._totals[event] = self._totals.get(event, 0) + count
+            if monotonic() - self._start < self.interval:
+                return
+        self.flush()
+
+
+    def flush(self) -> None:
+        """
+        Log the counts since the last summary.
+        """
+        with self._lock:
+            counts, self._counts = self._counts, {}
+            now = monotonic()
+            elapsed, self._start = now - self._start, now
+        if not self.logger.isEnabledFor(self.level):
+            return
+        for event, count in counts.items():
+            self.logger.log(self.level, self.template.format(count=count, event=event, elapsed=elapsed))
+
+
+NDJSON_TYPES = ('ndjson', 'jsonl')
+SQLITE_TYPES = ('db', 'sqlite', 'sqlite3')
+
+
+def read_updated(in_file:str, obj_type:Union[dict, list]=None, sheet_name:str=None, data_only:bool=False) -> Union[List[Dict[str, str]],Any]: 
     
     """
     Read in a file of already updated records.
@@ -148,6 +392,8 @@ def read_updated(in_file:str, obj_type:Union[dict, list]=None, sheet_name:str=No
     
     - in_file: file containing the data to read.
     - obj_type: default object type to return if file is empty or doesn't exist.
+    - sheet_name: sheet to read if the file is an Excel file.
+    - data_only: return the values Excel last calculated for formula cells instead of the formulas. Cells are empty if the workbook was never calculated.
 
     Returns:
 
@@ -159,20 +405,22 @@ def read_updated(in_file:str, obj_type:Union[dict, list]=None, sheet_name:str=No
     updated_records = obj_type
     _file_type = in_file.split('.')[-1].lower()
     if _file_type in ['xlsx', 'xlsm']:
-        return _read_excel(in_file, sheet_name)
+        return _read_excel(in_file, sheet_name, data_only)
     if os.path.exists(in_file) and os.path.getsize(in_file) > 0:
         with open(in_file, 'r', encoding='utf-8-sig') as f:
             if _file_type == 'json':
                 updated_records = json.load(f)
+            elif _file_type in NDJSON_TYPES:
+                updated_records = [json.loads(line) for line in f if line.strip()]
             elif _file_type == 'csv':
                 c = csv.DictReader(f)
                 updated_records = [row for row in c]
             else:
-                raise TypeError('File name provided is not an expected type of xlsx, json or csv.')
+                raise TypeError('File name provided is not an expected type of xlsx, json, ndjson or csv.')
     return updated_records
 
 
-def _read_excel(file_path:str, sheet_name:str=None) -> List[Dict[str, str]]:
+def _read_excel(file_path:str, sheet_name:str=None, data_only:bool=False) -> List[Dict[str, str]]:
     """
     Reads the contents of the first sheet in an Excel (.xlsx) file.
 
@@ -182,35 +430,236 @@ def _read_excel(file_path:str, sheet_name:str=None) -> List[Dict[str, str]]:
     Returns:
     - List of dictionaries, where each dictionary represents a row, with keys as column headers.
     """
+    return list(_iter_excel(file_path, sheet_name, data_only=data_only))
+
+
+def _iter_excel(file_path:str, sheet_name:str=None, columns:Iterable[str]=None, data_only:bool=False) -> Generator[Dict[str, str], None, None]:
+    """
+    Streams the rows of an Excel (.xlsx) file using openpyxl's read-only mode.
+
+    Parameters:
+    - file_path: Path to the Excel file to read.
+    - sheet_name: Sheet to read. Defaults to the first sheet.
+    - columns: Only include these columns in the returned rows.
+    - data_only: Return the cached values of formula cells instead of the formulas.
+
+    Yields:
+    - Dictionary for each row, with keys as column headers.
+    """
+    from openpyxl import load_workbook
     while True:
         try:
-            workbook = load_workbook(file_path)
+            workbook = load_workbook(file_path, read_only=True, data_only=data_only)
             break
         except PermissionError:
             print("\a")
             user_input = input("\n[WARNING] The file is currently in use. Please close the file and press Enter to try again, or type 'cancel' to stop: ")
             if user_input.lower() == 'cancel':
-                return []
-    sheets = workbook.sheetnames
-    if sheet_name is None:
-        first_sheet = workbook[sheets[0]]
-    elif sheet_name in sheets:
-        first_sheet = workbook[sheet_name]
-    else:
-        raise ValueError(f"Sheet name {sheet_name} not found in workbook.")
-    data = []
-    
-    # Get the headers (first row)
-    headers = next(first_sheet.iter_rows(min_row=1, max_row=1, values_only=True))
+                return
+    try:
+        sheets = workbook.sheetnames
+        if sheet_name is None:
+            first_sheet = workbook[sheets[0]]
+        elif sheet_name in sheets:
+            first_sheet = workbook[sheet_name]
+        else:
+            raise ValueError(f"Sheet name {sheet_name} not found in workbook.")
+        rows = first_sheet.iter_rows(values_only=True)
 
-    
-    # Iterate over the remaining rows and build dictionaries
-    for row in first_sheet.iter_rows(min_row=2, values_only=True):
-        row_strings = [str(cell) if cell is not None else "" for cell in row]
-        row_data = dict(zip(headers, row_strings))
-        data.append(row_data)
-    
-    return data
+        # Get the headers (first row)
+        headers = next(rows, None)
+        if headers is None:
+            return
+        indexes = [i for i, h in enumerate(headers) if columns is None or h in columns]
+        selected = [headers[i] for i in indexes]
+        for row in rows:
+            width = len(row)
+            yield {
+                h: (str(row[i]) if row[i] is not None else "") if i < width else ""
+                for h, i in zip(selected, indexes)
+            }
+    finally:
+        workbook.close()
+
+
+def iter_updated(in_file:str, columns:Iterable[str]=None, chunk_size:int=None, sheet_name:str=None, data_only:bool=False) -> Generator[Union[Dict[str, Any], List[Dict[str, Any]]], None, None]:
+    """
+    Stream the records of a file without loading the whole file into memory.
+
+    csv, ndjson and Excel files are read a row at a time. Excel files are opened in read-only mode.
+    json files have to be parsed in full before records are yielded.
+
+    Parameters:
+
+    - in_file: file containing the data to read.
+    - columns: only include these columns in the yielded records.
+    - chunk_size: yield lists of up to this many records instead of single records.
+    - sheet_name: sheet to read if the file is an Excel file.
+    - data_only: return the values Excel last calculated for formula cells instead of the formulas. Cells are empty if the workbook was never calculated.
+
+    Yields:
+
+    - dictionary for each record, or a list of dictionaries if chunk_size is provided.
+    """
+    if columns is not None:
+        columns = set(columns)
+    records = _iter_records(in_file, columns, sheet_name, data_only)
+    if not chunk_size:
+        yield from records
+        return
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _iter_records(in_file:str, columns:set=None, sheet_name:str=None, data_only:bool=False) -> Generator[Dict[str, Any], None, None]:
+    _file_type = in_file.split('.')[-1].lower()
+    if _file_type in ['xlsx', 'xlsm']:
+        yield from _iter_excel(in_file, sheet_name, columns, data_only)
+        return
+    if not os.path.exists(in_file) or os.path.getsize(in_file) == 0:
+        return
+    with open(in_file, 'r', encoding='utf-8-sig', newline='') as f:
+        if _file_type == 'csv':
+            if columns is None:
+                yield from csv.DictReader(f)
+                return
+            c = csv.reader(f)
+            headers = next(c, None)
+            if headers is None:
+                return
+            indexes = [i for i, h in enumerate(headers) if h in columns]
+            selected = [headers[i] for i in indexes]
+            last = max(indexes, default=-1)
+            for row in c:
+                if len(row) > last:
+                    yield dict(zip(selected, [row[i] for i in indexes]))
+                else:
+                    yield {h: row[i] if i < len(row) else None for h, i in zip(selected, indexes)}
+            return
+        if _file_type in NDJSON_TYPES:
+            lines = (json.loads(line) for line in f if line.strip())
+        elif _file_type == 'json':
+            lines = json.load(f)
+            if isinstance(lines, dict):
+                lines = [lines]
+        else:
+            raise TypeError('File name provided is not an expected type of xlsx, json, ndjson or csv.')
+        for record in lines:
+            if columns is not None and isinstance(record, dict):
+                record = {k: v for k, v in record.items() if k in columns}
+            yield record
+
+
+class ExcelStreamWriter():
+    """
+    Writes rows of dictionaries to an Excel (.xlsx) file using openpyxl's write-only mode.
+
+    Rows are streamed to the sheets as they are written instead of building the workbook in memory.
+    The header of each sheet is taken from the first row written to it.
+    The file is saved when the writer is closed. Nothing is saved if the with block raises an exception.
+
+    Usage:
+    ::
+
+        with ExcelStreamWriter('containers.xlsx') as writer:
+            for pcn, response in zip(pcn_list, responses):
+                response.save_xlsx(sheet_name=pcn, writer=writer)
+    """
+    _CELL_TYPES = (str, int, float, bool, datetime, date, time, timedelta)
+
+    def __init__(self, out_file:str):
+        """
+        Parameters:
+        - out_file: xlsx file to save.
+        """
+        if not out_file.lower().endswith('.xlsx'):
+            raise TypeError('File name provided is not an expected type of xlsx.')
+        from openpyxl import Workbook
+        self.out_file = out_file
+        self._workbook = Workbook(write_only=True)
+        self._sheets = {}
+        self._lock = threading.Lock()
+
+
+    def __repr__(self):
+        return f"ExcelStreamWriter(out_file={self.out_file}, sheets={list(self._sheets)})"
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # Don't replace an existing file with a partly written workbook.
+        if exc_type is not None:
+            self.discard()
+        else:
+            self.close()
+
+
+    def write(self, rows:Iterable[Dict[str, Any]], sheet_name:str='Sheet1') -> int:
+        """
+        Append rows to a sheet. The sheet is created on the first write.
+
+        Parameters:
+        - rows: dictionaries to write.
+        - sheet_name: sheet to append to.
+
+        Returns:
+        - number of rows written.
+        """
+        count = 0
+        cell_types = self._CELL_TYPES
+        with self._lock:
+            if self._workbook is None:
+                raise ValueError('ExcelStreamWriter is already closed.')
+            sheet = self._sheets.get(sheet_name)
+            for row in rows:
+                if sheet is None:
+                    sheet = (self._workbook.create_sheet(sheet_name), list(row.keys()))
+                    self._sheets[sheet_name] = sheet
+                    sheet[0].append(sheet[1])
+                worksheet, headers = sheet
+                worksheet.append([
+                    v if v is None or isinstance(v, cell_types) else str(v)
+                    for v in map(row.get, headers)
+                ])
+                count += 1
+        return count
+
+
+    def close(self) -> None:
+        """
+        Save the workbook.
+        """
+        with self._lock:
+            if self._workbook is None:
+                return
+            if not self._sheets:
+                self._workbook.create_sheet('Sheet1')
+            # Saved to a temporary file first so a failed save doesn't leave a broken file in place of the existing one.
+            tmp_file = f'{self.out_file}.tmp'
+            try:
+                self._workbook.save(tmp_file)
+                os.replace(tmp_file, self.out_file)
+            finally:
+                self._workbook = None
+                if os.path.exists(tmp_file):
+                    os.remove(tmp_file)
+
+
+    def discard(self) -> None:
+        """
+        Close the writer without saving. Any existing file is left unchanged.
+        """
+        with self._lock:
+            self._workbook = None
 
 
 def save_updated_overwrite(in_file:str, obj:dict) -> None:
@@ -220,20 +669,28 @@ def save_updated_overwrite(in_file:str, obj:dict) -> None:
     Parameters:
     
     - in_file: file to use to save
-    - obj: json object to write to file. Expects a list containing dictionaries.
+    - obj: json object to write to file. Expects a list containing dictionaries. A single dictionary is saved as a one record list.
     """
     if not obj:
         return
+    if isinstance(obj, dict):
+        obj = [obj]
     _file_type = in_file.split('.')[-1].lower()
+    if _file_type == 'xlsx':
+        with ExcelStreamWriter(in_file) as writer:
+            writer.write(obj)
+        return
     with open(in_file, 'w+', encoding='utf-8') as f:
         if _file_type == 'json':
             f.write(json.dumps(obj, indent=4))
+        elif _file_type in NDJSON_TYPES:
+            f.writelines(json.dumps(record, default=str) + '\n' for record in obj)
         elif _file_type == 'csv':
             c = csv.DictWriter(f, fieldnames=obj[0].keys(), lineterminator='\n')
             c.writeheader()
             c.writerows(obj)
         else:
-            raise TypeError('File name provided is not an expected type of json or csv.')
+            raise TypeError('File name provided is not an expected type of json, ndjson, csv or xlsx.')
         
 
 def save_updated(in_file:str, obj:Union[dict, list], overwrite:bool=False) -> None:
@@ -269,6 +726,11 @@ def save_updated(in_file:str, obj:Union[dict, list], overwrite:bool=False) -> No
         with open(in_file, 'w', encoding='utf-8') as f:
             json.dump(existing_data + obj, f, indent=4)
 
+    # Append NDJSON data. Only the new record is written.
+    elif _file_type in NDJSON_TYPES:
+        with open(in_file, 'a', encoding='utf-8') as f:
+            f.writelines(json.dumps(record, default=str) + '\n' for record in obj)
+
     # Append CSV data
     elif _file_type == 'csv':
         file_exists = os.path.isfile(in_file)
@@ -280,10 +742,455 @@ def save_updated(in_file:str, obj:Union[dict, list], overwrite:bool=False) -> No
                 writer.writeheader()
             
             writer.writerows(obj)
+
+    # Append Excel data. The workbook has to be loaded and saved in full.
+    elif _file_type == 'xlsx':
+        if not os.path.exists(in_file) or os.path.getsize(in_file) == 0:
+            return save_updated_overwrite(in_file, obj)
+        from openpyxl import load_workbook
+        workbook = load_workbook(in_file)
+        sheet = workbook[workbook.sheetnames[0]]
+        headers = [c.value for c in next(sheet.iter_rows(min_row=1, max_row=1))]
+        for record in obj:
+            sheet.append([record.get(h) for h in headers])
+        workbook.save(in_file)
     else:
-        raise TypeError('File name provided is not an expected type of json or csv.')
+        raise TypeError('File name provided is not an expected type of json, ndjson, csv or xlsx.')
     
 
+def _lock_file(f) -> None:
+    if os.name == 'nt':
+        import msvcrt
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+    else:
+        import fcntl
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock_file(f) -> None:
+    if os.name == 'nt':
+        import msvcrt
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class RecordLedger():
+    """
+    Append-only file of processed records with constant time membership checks.
+
+    Intended as a replacement for read_updated/save_updated when skipping records processed by a previous run.
+    Records are kept as canonical keys in an in-memory set and appended to the file in batches.
+
+    Supported file types:
+    - .ndjson/.jsonl - one json record per line. A lock file is used so multiple processes can write to the same ledger.
+    - .db/.sqlite/.sqlite3 - SQLite database in WAL mode.
+
+    Records written by other processes are picked up before each membership check.
+
+    Usage:
+    ::
+
+        with RecordLedger(os.path.join(batch_folder, 'updated.ndjson')) as updates:
+            for r in rows:
+                if r in updates:
+                    continue
+                ux.call_data_source(...)
+                updates.add(r)
+    """
+    def __init__(self, path:str, key_fields:List[str]=None, flush_every:int=100, fsync:bool=True):
+        """
+        Parameters:
+        - path: ledger file path.
+        - key_fields: only use these fields to identify a record. Defaults to the whole record.
+        - flush_every: number of new records to buffer before writing them to the file.
+        - fsync: force the written records to disk on every flush.
+        """
+        self.path = path
+        self.key_fields = key_fields
+        self.flush_every = max(1, flush_every)
+        self.fsync = fsync
+        self._file_type = path.split('.')[-1].lower()
+        if self._file_type not in NDJSON_TYPES + SQLITE_TYPES:
+            raise TypeError(f'File name provided is not an expected type of {NDJSON_TYPES + SQLITE_TYPES}.')
+        self._keys = set()
+        self._pending = []
+        self._lock = threading.RLock()
+        self._offset = 0
+        self._file_id = None
+        self._last_rowid = 0
+        self._connection = None
+        if self._file_type in SQLITE_TYPES:
+            self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(f"PRAGMA synchronous={'FULL' if fsync else 'NORMAL'}")
+            self._connection.execute('CREATE TABLE IF NOT EXISTS records (key TEXT PRIMARY KEY, record TEXT NOT NULL)')
+            self._connection.commit()
+        self.refresh()
+
+
+    def __repr__(self):
+        return f"RecordLedger(path={self.path}, records={len(self)}, pending={len(self._pending)})"
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def __len__(self):
+        return len(self._keys)
+
+
+    def __contains__(self, record:dict) -> bool:
+        key = self.key(record)
+        if key in self._keys:
+            return True
+        self.refresh()
+        return key in self._keys
+
+
+    def __iter__(self) -> Generator[dict, None, None]:
+        self.flush()
+        if self._connection is not None:
+            with self._lock:
+                rows = self._connection.execute('SELECT record FROM records ORDER BY rowid').fetchall()
+            for (record,) in rows:
+                yield json.loads(record)
+            return
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+    def key(self, record:dict) -> str:
+        """
+        Canonical key for a record. Field order does not matter.
+        """
+        if self.key_fields:
+            record = {k: record.get(k) for k in self.key_fields}
+        return json.dumps(record, sort_keys=True, separators=(',', ':'), default=str)
+
+
+    def add(self, record:dict) -> bool:
+        """
+        Add a record to the ledger.
+
+        Returns:
+        - False if the record was already in the ledger.
+        """
+        key = self.key(record)
+        with self._lock:
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+            self._pending.append((key, record))
+            if len(self._pending) >= self.flush_every:
+                self.flush()
+        return True
+
+
+    def extend(self, records:Iterable[dict]) -> None:
+        """
+        Add multiple records to the ledger.
+        """
+        for record in records:
+            self.add(record)
+
+
+    def refresh(self) -> set:
+        """
+        Load records written to the file since the last refresh, including those from other processes.
+
+        Returns:
+        - set of keys read from the file.
+        """
+        new_keys = set()
+        with self._lock:
+            if self._connection is not None:
+                rows = self._connection.execute('SELECT rowid, key FROM records WHERE rowid > ?', (self._last_rowid,)).fetchall()
+                for rowid, key in rows:
+                    new_keys.add(key)
+                    self._last_rowid = max(self._last_rowid, rowid)
+                self._keys |= new_keys
+                return new_keys
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                return new_keys
+            file_id = (stat.st_dev, stat.st_ino)
+            if file_id != self._file_id or stat.st_size < self._offset:
+                # File was compacted or replaced.
+                self._file_id = file_id
+                self._offset = 0
+            if stat.st_size == self._offset:
+                return new_keys
+            with open(self.path, 'rb') as f:
+                f.seek(self._offset)
+                data = f.read()
+            # Only read complete lines. A partial line is picked up on the next refresh.
+            end = data.rfind(b'\n') + 1
+            for line in data[:end].splitlines():
+                if line.strip():
+                    new_keys.add(self.key(json.loads(line)))
+            self._keys |= new_keys
+            self._offset += end
+        return new_keys
+
+
+    def flush(self) -> None:
+        """
+        Write any buffered records to the file.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+            if self._connection is not None:
+                self._connection.executemany('INSERT OR IGNORE INTO records (key, record) VALUES (?, ?)',
+                                             [(key, json.dumps(record, default=str)) for key, record in pending])
+                self._connection.commit()
+                return
+            with open(self.path + '.lock', 'a+b') as lock:
+                _lock_file(lock)
+                try:
+                    # Skip records another process wrote since the last refresh.
+                    written = self.refresh()
+                    data = ''.join(json.dumps(record, default=str) + '\n' for key, record in pending if key not in written).encode('utf-8')
+                    with open(self.path, 'ab') as f:
+                        f.write(data)
+                        f.flush()
+                        if self.fsync:
+                            os.fsync(f.fileno())
+                    self._offset = os.path.getsize(self.path)
+                    stat = os.stat(self.path)
+                    self._file_id = (stat.st_dev, stat.st_ino)
+                finally:
+                    _unlock_file(lock)
+
+
+    def compact(self) -> None:
+        """
+        Rewrite the ledger file with one line per unique record.
+        """
+        with self._lock:
+            self.flush()
+            if self._connection is not None:
+                self._connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+                self._connection.execute('VACUUM')
+                return
+            if not os.path.exists(self.path):
+                return
+            with open(self.path + '.lock', 'a+b') as lock:
+                _lock_file(lock)
+                try:
+                    seen = set()
+                    temp_path = f'{self.path}.{os.getpid()}.tmp'
+                    with open(self.path, 'r', encoding='utf-8') as src, open(temp_path, 'w', encoding='utf-8') as dst:
+                        for line in src:
+                            if not line.strip():
+                                continue
+                            key = self.key(json.loads(line))
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                            dst.write(line if line.endswith('\n') else line + '\n')
+                        dst.flush()
+                        os.fsync(dst.fileno())
+                    os.replace(temp_path, self.path)
+                    self._keys |= seen
+                    stat = os.stat(self.path)
+                    self._file_id = (stat.st_dev, stat.st_ino)
+                    self._offset = stat.st_size
+                finally:
+                    _unlock_file(lock)
+
+
+    def close(self) -> None:
+        """
+        Flush buffered records and close the ledger.
+        """
+        self.flush()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+def _hour_12(hour:str, am_pm:str) -> int:
+    hour = int(hour)
+    if not 1 <= hour <= 12:
+        raise ValueError(f'Hour {hour} is not valid for a 12 hour clock.')
+    return hour % 12 + (12 if am_pm.upper() == 'PM' else 0)
+
+
+def _parse_mdy_hms_p(m) -> datetime:
+    month, day, year, hour, minute, second, am_pm = m.groups()
+    return datetime(int(year), int(month), int(day), _hour_12(hour, am_pm), int(minute), int(second))
+
+
+def _parse_bdy_hm_p(m) -> datetime:
+    month, day, year, hour, minute, am_pm = m.groups()
+    return datetime(int(year), _MONTHS[month.upper()], int(day), _hour_12(hour, am_pm), int(minute))
+
+
+def _parse_iso(m) -> datetime:
+    year, month, day, hour, minute, second, fraction = m.groups()
+    microsecond = int(fraction.ljust(6, '0')) if fraction else 0
+    return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), microsecond)
+
+
+# Precompiled parsers for the formats Plex returns. Equivalent to datetime.strptime for these formats, without the per-call format handling.
+_FAST_PARSERS = {
+    "%m/%d/%Y %I:%M:%S %p": (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4}) (\d{1,2}):(\d{1,2}):(\d{1,2}) ([AaPp][Mm])$'), _parse_mdy_hms_p),
+    "%b %d %Y %I:%M%p": (re.compile(r'([A-Za-z]{3}) (\d{1,2}) (\d{4}) (\d{1,2}):(\d{1,2})([AaPp][Mm])$'), _parse_bdy_hm_p),
+    PLEX_ISO_MS_FORMAT: (re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})T(\d{1,2}):(\d{1,2}):(\d{1,2})\.(\d{1,6})Z$'), _parse_iso),
+    PLEX_ISO_FORMAT: (re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})T(\d{1,2}):(\d{1,2}):(\d{1,2})()Z$'), _parse_iso),
+}
+
+
+def _parse_format(datestring:str, date_format:str) -> Optional[datetime]:
+    fast_parser = _FAST_PARSERS.get(date_format)
+    try:
+        if fast_parser:
+            m = fast_parser[0].match(datestring)
+            if m is None or (date_format == "%b %d %Y %I:%M%p" and m.group(1).upper() not in _MONTHS):
+                return None
+            return fast_parser[1](m)
+        return datetime.strptime(datestring, date_format)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=65536)
+def _parse_cached(datestring:str, formats:Tuple[str, ...]) -> Tuple[Optional[datetime], Optional[str]]:
+    for date_format in formats:
+        parsed = _parse_format(datestring, date_format)
+        if parsed is not None:
+            return parsed, date_format
+    return None, None
+
+
+class PlexDateParser():
+    """
+    Parses datetime strings from Plex reports and data sources.
+
+    The last successful format is remembered per column so it is tried first for the next value.
+    Results are memoized since the same dates repeat often in Plex data.
+    """
+    def __init__(self, formats:Tuple[str, ...]=PLEX_DATE_FORMATS):
+        self.formats = tuple(formats)
+        self._column_formats = {}
+
+
+    def __repr__(self):
+        return f"PlexDateParser(formats={self.formats})"
+
+
+    def parse(self, datestring:str, column:str=None) -> Optional[datetime]:
+        """
+        Parse a datetime string.
+
+        Parameters:
+        - datestring: the string to parse. Repeated or non-printing whitespace is normalized.
+        - column: optional column name used to remember the last matching format.
+
+        Returns:
+        - naive datetime object or None if no format matches.
+        """
+        # When converting datetime objects to varchars, the format is using spaces for padding rather than zeroes.
+        standardized_datestring = ' '.join(datestring.split())
+        last_format = self._column_formats.get(column)
+        if last_format:
+            parsed = _parse_format(standardized_datestring, last_format)
+            if parsed is not None:
+                return parsed
+        parsed, date_format = _parse_cached(standardized_datestring, self.formats)
+        if date_format is not None:
+            self._column_formats[column] = date_format
+        return parsed
+
+
+    def format(self, datestring:str, column:str=None, **kwargs) -> Optional[str]:
+        """
+        Parse a datetime string and return it in the Plex web service format.
+
+        Parameters:
+        - datestring: the string to parse.
+        - column: optional column name used to remember the last matching format.
+        - kwargs: plex_date_formatter keyword arguments.
+
+        Returns:
+        - Plex formatted datetime string or None if no format matches.
+        """
+        parsed = self.parse(datestring, column)
+        if parsed is None:
+            return None
+        return plex_date_formatter(parsed, **kwargs)
+
+
+_default_date_parser = PlexDateParser()
+
+
+def parse_plex_datetime(datestring:str, column:str=None, formats:Tuple[str, ...]=None) -> Optional[datetime]:
+    """
+    Parse a datetime string from any of the common Plex formats.
+
+    Parameters:
+    - datestring: the string to parse.
+    - column: optional column name used to remember the last matching format.
+    - formats: optional formats to use instead of PLEX_DATE_FORMATS.
+
+    Returns:
+    - naive datetime object or None if no format matches.
+    """
+    if formats is not None:
+        return _parse_cached(' '.join(datestring.split()), tuple(formats))[0]
+    return _default_date_parser.parse(datestring, column)
+
+
+def is_plex_iso_datetime(datestring:str) -> bool:
+    """
+    Check if a string is a Plex web service datetime with milliseconds. e.g. 2024-01-01T04:00:00.000Z
+    """
+    return isinstance(datestring, str) and _parse_format(datestring, PLEX_ISO_MS_FORMAT) is not None
+
+
+@lru_cache(maxsize=None)
+def _get_timezone(tz:str):
+    import pytz
+    return pytz.timezone(tz)
+
+
+@lru_cache(maxsize=65536)
+def _utc_offset(tz:str, year:int, month:int, day:int, hour:int, minute:int) -> timedelta:
+    return _get_timezone(tz).localize(datetime(year, month, day, hour, minute)).utcoffset()
+
+
+def _local_utc_offset(tz:str, _date:datetime) -> timedelta:
+    # Offsets are cached per minute. Older transitions can fall part way through a minute.
+    # No offset change is shorter than a minute, so a transition inside the minute shows as a different offset at the next minute.
+    offset = _utc_offset(tz, _date.year, _date.month, _date.day, _date.hour, _date.minute)
+    if _date.second or _date.microsecond:
+        next_minute = _date.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        if _utc_offset(tz, next_minute.year, next_minute.month, next_minute.day, next_minute.hour, next_minute.minute) != offset:
+            return _get_timezone(tz).localize(_date).utcoffset()
+    return offset
+
+
 def plex_date_formatter(*args: datetime|int, date_offset:int=0, tz_convert:bool=True, tz:str="America/New_York") -> str:
     """
     Takes 'normal' date formats and converts them to a Plex web service format (ISO format)
@@ -295,18 +1202,277 @@ def plex_date_formatter(*args: datetime|int, date_offset:int=0, tz_convert:bool=
         date_offset arg will add days to the provided time
         Useful when providing just a datetime object to the function
     """
-    if isinstance(args[0], (datetime, date)):
+    if isinstance(args[0], datetime):
         _date = args[0]
+    elif isinstance(args[0], date):
+        _date = datetime(args[0].year, args[0].month, args[0].day)
     else:
         _date = datetime(*args)
     if tz_convert:
-        _tz = pytz.timezone(tz)
-        _date = _tz.localize(_date).astimezone(timezone.utc)
+        if _date.tzinfo is not None:
+            _date = _date.astimezone(timezone.utc).replace(tzinfo=None)
+        else:
+            _date = _date - _local_utc_offset(tz, _date)
     _date += timedelta(days=date_offset)
-    f_date = _date.strftime('%Y-%m-%dT%H:%M:%SZ')
+    f_date = _date.replace(tzinfo=None).isoformat(sep='T', timespec='seconds') + 'Z'
     return f_date
 
 
+_ARRAY_PATTERNS = {
+    "%m/%d/%Y %I:%M:%S %p": re.compile(r'^[^\S\n]*(\d{1,2})/(\d{1,2})/(\d{4})[^\S\n]+(\d{1,2}):(\d{1,2}):(\d{1,2})[^\S\n]+([AaPp][Mm])[^\S\n]*$', re.M),
+    "%b %d %Y %I:%M%p": re.compile(r'^[^\S\n]*([A-Za-z]{3})[^\S\n]+(\d{1,2})[^\S\n]+(\d{4})[^\S\n]+(\d{1,2}):(\d{1,2})()([AaPp][Mm])[^\S\n]*$', re.M),
+    PLEX_ISO_MS_FORMAT: re.compile(r'^[^\S\n]*(\d{4})-(\d{1,2})-(\d{1,2})T(\d{1,2}):(\d{1,2}):(\d{1,2})\.(\d{1,6})Z[^\S\n]*$', re.M),
+    PLEX_ISO_FORMAT: re.compile(r'^[^\S\n]*(\d{4})-(\d{1,2})-(\d{1,2})T(\d{1,2}):(\d{1,2}):(\d{1,2})()Z[^\S\n]*$', re.M),
+}
+
+
+def _parse_report_array(uniques:'np.ndarray') -> Optional['np.ndarray']:
+    """
+    Parse distinct datetime strings with a single regex pass and numpy date arithmetic.
+
+    Only used when every non-empty value matches the same Plex format. Returns None otherwise.
+    """
+    empty = uniques == ''
+    values = uniques[~empty]
+    if values.size == 0:
+        return np.full(uniques.shape, np.datetime64('NaT', 'ms'))
+    joined = '\n'.join(values.tolist())
+    if joined.count('\n') != values.size - 1:
+        return None
+    for date_format, pattern in _ARRAY_PATTERNS.items():
+        matches = pattern.findall(joined)
+        if len(matches) == values.size:
+            break
+    else:
+        return None
+    parts = np.array(matches, dtype=object)
+    if date_format == "%b %d %Y %I:%M%p":
+        names, name_index = np.unique(np.char.upper(parts[:, 0].astype(str)), return_inverse=True)
+        if any(n not in _MONTHS for n in names.tolist()):
+            return None
+        month = np.array([_MONTHS[n] for n in names.tolist()], dtype=np.int64)[name_index.reshape(-1)]
+        day, year, hour, minute = (parts[:, i].astype(np.int64) for i in (1, 2, 3, 4))
+        second = np.zeros(values.size, dtype=np.int64)
+    else:
+        if date_format in (PLEX_ISO_MS_FORMAT, PLEX_ISO_FORMAT):
+            year, month, day, hour, minute, second = (parts[:, i].astype(np.int64) for i in range(6))
+        else:
+            month, day, year, hour, minute, second = (parts[:, i].astype(np.int64) for i in range(6))
+    microsecond = np.zeros(values.size, dtype=np.int64)
+    valid = (month >= 1) & (month <= 12) & (minute <= 59) & (second <= 59) & (day >= 1)
+    if date_format in (PLEX_ISO_MS_FORMAT, PLEX_ISO_FORMAT):
+        valid &= hour <= 23
+        microsecond = np.char.ljust(parts[:, 6].astype(str), 6, '0').astype(np.int64)
+    else:
+        am_pm = parts[:, 6].astype(str)
+        valid &= (hour >= 1) & (hour <= 12)
+        hour = hour % 12 + np.where(np.char.upper(am_pm) == 'PM', 12, 0)
+    months = ((year - 1970) * 12 + np.clip(month, 1, 12) - 1).astype('datetime64[M]')
+    month_start = months.astype('datetime64[D]')
+    days_in_month = ((months + 1).astype('datetime64[D]') - month_start).astype(np.int64)
+    valid &= day <= days_in_month
+    converted = (month_start + (day - 1).astype('timedelta64[D]')).astype('datetime64[ms]')
+    converted = converted + (hour * 3600000 + minute * 60000 + second * 1000 + microsecond // 1000).astype('timedelta64[ms]')
+    converted[~valid] = np.datetime64('NaT', 'ms')
+    result = np.full(uniques.shape, np.datetime64('NaT', 'ms'))
+    result[~empty] = converted
+    return result
+
+
+def _require_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError('numpy is required for array date functions. Install it with "pip install pmc-automation-tools[numpy]".') from None
+        np = numpy
+
+
+def parse_plex_datetime_array(values:Iterable[str], column:str=None, formats:Tuple[str, ...]=None) -> 'np.ndarray':
+    """
+    Convert a column of Plex datetime strings to a numpy datetime64[ms] array.
+
+    Each distinct value is only parsed once. Web service formatted columns are converted by numpy directly.
+
+    Parameters:
+    - values: iterable of datetime strings. Empty or invalid values become NaT.
+    - column: optional column name used to remember the last matching format.
+    - formats: optional formats to use instead of PLEX_DATE_FORMATS.
+
+    Returns:
+    - numpy datetime64[ms] array. Values are naive, in the same timezone as the source strings.
+    """
+    _require_numpy()
+    values = np.asarray(list(values), dtype=object)
+    if values.size == 0:
+        return np.array([], dtype='datetime64[ms]')
+    empty = np.frompyfunc(lambda v: v is None or (isinstance(v, str) and not v.strip()), 1, 1)(values).astype(bool)
+    uniques, inverse = np.unique(np.where(empty, '', values).astype(str), return_inverse=True)
+    inverse = inverse.reshape(-1)
+    if formats is None:
+        converted = _parse_report_array(uniques)
+        if converted is not None:
+            return converted[inverse]
+    parsed = [parse_plex_datetime(u, column, formats) if u else None for u in uniques]
+    converted = np.array([np.datetime64(p, 'ms') if p is not None else np.datetime64('NaT', 'ms') for p in parsed], dtype='datetime64[ms]')
+    return converted[inverse]
+
+
+@lru_cache(maxsize=None)
+def _transition_table(tz:str) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    UTC transition times and UTC offsets for a timezone as millisecond numpy arrays.
+    """
+    _tz = _get_timezone(tz)
+    if not hasattr(_tz, '_utc_transition_times'):
+        offset = _tz.utcoffset(datetime(2000, 1, 1)) or timedelta(0)
+        return (np.array([np.iinfo(np.int64).min], dtype=np.int64),
+                np.array([offset // timedelta(milliseconds=1)], dtype=np.int64))
+    transitions = np.array(_tz._utc_transition_times, dtype='datetime64[ms]').astype(np.int64)
+    offsets = np.array([info[0] // timedelta(milliseconds=1) for info in _tz._transition_info], dtype=np.int64)
+    return transitions, offsets
+
+
+def convert_timezone_array(dates:'np.ndarray', tz:str="America/New_York", to_utc:bool=True) -> 'np.ndarray':
+    """
+    Convert an array of naive datetime64 values between a timezone and UTC.
+
+    Uses the timezone's UTC offset table so the whole array is converted without a python loop.
+    Local times within a day of a transition are converted with plex_date_formatter's offsets, so ambiguous and non-existent times give the same result.
+
+    Parameters:
+    - dates: datetime64 array or anything numpy can convert to one.
+    - tz: timezone name.
+    - to_utc: convert from tz to UTC if True, otherwise from UTC to tz.
+
+    Returns:
+    - datetime64[ms] array.
+    """
+    _require_numpy()
+    dates = np.asarray(dates)
+    if not np.issubdtype(dates.dtype, np.datetime64):
+        dates = dates.astype('datetime64[ms]')
+    dates = dates.astype('datetime64[ms]')
+    valid = ~np.isnat(dates)
+    values = dates[valid].astype(np.int64)
+    transitions, offsets = _transition_table(tz)
+
+    def _offset_index(utc_values):
+        return np.maximum(np.searchsorted(transitions, utc_values, side='right') - 1, 0)
+
+    if to_utc:
+        # Offsets a day before and after each local time cover any transition near it.
+        day = 86400000
+        before = _offset_index(values - day)
+        after = _offset_index(values + day)
+        local_offsets = offsets[before]
+        # Times near a transition use the scalar offsets. Each distinct time is only localized once.
+        near = np.flatnonzero(before != after)
+        if near.size:
+            uniques, inverse = np.unique(values[near], return_inverse=True)
+            near_offsets = [_local_utc_offset(tz, datetime(1970, 1, 1) + timedelta(milliseconds=int(v))) // timedelta(milliseconds=1) for v in uniques]
+            local_offsets[near] = np.array(near_offsets, dtype=np.int64)[inverse.reshape(-1)]
+        converted_values = values - local_offsets
+    else:
+        converted_values = values + offsets[_offset_index(values)]
+    converted = dates.copy()
+    converted[valid] = converted_values.astype('datetime64[ms]')
+    return converted
+
+
+def plex_date_formatter_array(dates:'np.ndarray', date_offset:int=0, tz_convert:bool=True, tz:str="America/New_York") -> List[Optional[str]]:
+    """
+    Array version of plex_date_formatter. Converts a whole column of dates to the Plex web service format.
+
+    Parameters:
+    - dates: datetime64 array, list of datetime objects, or anything numpy can convert to datetime64.
+    - date_offset: days to add to the dates.
+    - tz_convert: convert the dates from tz to UTC.
+    - tz: timezone of the provided dates.
+
+    Returns:
+    - list of Plex formatted strings. NaT values are returned as None.
+    """
+    _require_numpy()
+    dates = np.asarray(dates)
+    if not np.issubdtype(dates.dtype, np.datetime64):
+        dates = dates.astype('datetime64[ms]')
+    dates = dates.astype('datetime64[s]')
+    if tz_convert:
+        dates = convert_timezone_array(dates, tz=tz, to_utc=True)
+    if date_offset:
+        dates = dates + np.timedelta64(date_offset, 'D')
+    formatted = np.char.add(np.datetime_as_string(dates, unit='s'), 'Z')
+    return [None if d else f for d, f in zip(np.isnat(dates).tolist(), formatted.tolist())]
+
+
+class WeekIndex(NamedTuple):
+    """
+    Result of get_week_index. Each attribute is an array with one value per input date.
+
+    - week_index: week of the date relative to the current week (0). Anything in the past is -1.
+    - year_offset: number of ISO weeks in the year of the date.
+    - group_start_date: first date of the week bucket, adjusted by week_start_offset.
+    - formatted_date: group_start_date in the Plex web service format.
+    """
+    week_index: 'np.ndarray'
+    year_offset: 'np.ndarray'
+    group_start_date: 'np.ndarray'
+    formatted_date: List[str]
+
+
+def _week_number(days:'np.ndarray') -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Year and strftime("%W") week number for an array of datetime64[D] values.
+    """
+    years = days.astype('datetime64[Y]')
+    day_of_year = (days - years.astype('datetime64[D]')).astype(np.int64)
+    # 1970-01-01 was a Thursday. Shifting by 3 gives Monday=0 like datetime.weekday().
+    weekday = (days.astype(np.int64) + 3) % 7
+    return years.astype(np.int64) + 1970, (day_of_year + 7 - weekday) // 7
+
+
+def get_week_index(dates:Union[Iterable[Union[str, datetime, date]], 'np.ndarray'], week_start_offset:int=0, today:Union[date, datetime]=None) -> WeekIndex:
+    """
+    Bucket dates into weeks relative to the current week.
+
+    Replaces the per-date get_week_index from the UX data source tools with numpy array math.
+
+    Parameters:
+    - dates: Plex datetime strings, date/datetime objects or a datetime64 array. Invalid dates are treated as past due.
+    - week_start_offset: days to shift the group start date. Weeks start on Monday (0). Use -1 for the Sunday before.
+    - today: date to use as the current week. Defaults to today.
+
+    Returns:
+    - WeekIndex named tuple of arrays.
+    """
+    _require_numpy()
+    dates = np.asarray(dates if isinstance(dates, np.ndarray) else list(dates))
+    if not np.issubdtype(dates.dtype, np.datetime64):
+        if dates.dtype.kind in ('U', 'S', 'O') and any(isinstance(d, str) for d in dates.flat):
+            dates = parse_plex_datetime_array(dates.tolist())
+        else:
+            dates = dates.astype('datetime64[ms]')
+    days = dates.astype('datetime64[D]')
+    days = np.where(np.isnat(days), np.datetime64('1990-01-01', 'D'), days)
+
+    today = today or date.today()
+    today = np.datetime64(date(today.year, today.month, today.day), 'D')
+    week_start = today - (today.astype(np.int64) + 3) % 7
+    week_start_year, week_start_week = _week_number(np.array([week_start]))
+
+    year, week = _week_number(days)
+    first_weekday = (days.astype('datetime64[Y]').astype('datetime64[D]').astype(np.int64) + 3) % 7
+    leap_year = ((year % 4 == 0) & (year % 100 != 0)) | (year % 400 == 0)
+    year_offset = np.where((first_weekday == 3) | (leap_year & (first_weekday == 2)), 53, 52)
+    # Anything less than 0 is considered equally past due
+    week_index = np.maximum(-1, week - week_start_week[0] + (year - week_start_year[0]) * year_offset)
+    group_start_date = week_start + (week_index * 7 + week_start_offset).astype('timedelta64[D]')
+    formatted_date = np.char.add(np.datetime_as_string(group_start_date.astype('datetime64[s]'), unit='s'), 'Z').tolist()
+    return WeekIndex(week_index, year_offset, group_start_date, formatted_date)
+
+
 def chunk_list(lst:list, chunk_size:int) -> Generator[list, None, None]:
     for i in range(0, len(lst), chunk_size):
         yield lst[i:i + chunk_size]
\ No newline at end of file
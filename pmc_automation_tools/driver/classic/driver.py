@@ -9,12 +9,14 @@ from pmc_automation_tools.driver.common import (
     INVISIBLE,
     CLICKABLE,
     EXISTS,
-    SIGNON_URL_PARTS
+    SIGNON_URL_PARTS,
+    instrumented
     )
 from selenium.common.exceptions import (
     TimeoutException,
     StaleElementReferenceException,
-    NoSuchElementException
+    NoSuchElementException,
+    WebDriverException
     )
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -27,8 +29,6 @@ from pmc_automation_tools.common.exceptions import (
     PlexAutomateError
 )
 import time
-from tkinter import filedialog
-from tkinter import messagebox
 import json
 import csv
 from pmc_automation_tools.common.utils import (
@@ -53,6 +53,10 @@ class ClassicDriver(PlexDriver):
         self._pcn_file_check()
 
     def _pcn_file_check(self):
+        if not os.path.exists(self.pcn_file_path):
+            # Only needed when prompting for the file. Not available on systems without Tk.
+            from tkinter import filedialog
+            from tkinter import messagebox
         while not os.path.exists(self.pcn_file_path):
             confirm = messagebox.askokcancel(title='Classic PCN reference file is missing',
                                             message=PCN_SQL)
@@ -94,6 +98,7 @@ class ClassicDriver(PlexDriver):
             j.write(json.dumps(_pcn_dict, indent=4, ensure_ascii=False))
 
 
+    @instrumented
     def wait_for_element(self, selector, *args, driver:Union['ClassicDriver','ClassicPlexElement']=None, timeout=15, type=VISIBLE, ignore_exception=False) -> 'ClassicPlexElement':
         return super().wait_for_element(selector, *args, driver=driver, timeout=timeout, type=type, ignore_exception=ignore_exception, element_class=ClassicPlexElement)
 
@@ -102,10 +107,16 @@ class ClassicDriver(PlexDriver):
         return super().wait_for_elements(selector, *args, driver=driver, timeout=timeout, type=type, ignore_exception=ignore_exception, element_class=ClassicPlexElement)
 
 
+    @instrumented
     def wait_for_gears(self, loading_timeout=10):
         super().wait_for_gears(PLEX_GEARS_SELECTOR, loading_timeout)
 
 
+    def wait_for_page_ready(self, timeout:float=10, quiet_period:float=0.1, poll_frequency:float=0.05, activity_timeout:float=0) -> bool:
+        return super().wait_for_page_ready(PLEX_GEARS_SELECTOR, timeout=timeout, quiet_period=quiet_period, poll_frequency=poll_frequency, activity_timeout=activity_timeout)
+
+
+    @instrumented
     def click_button(self, button_text:str, driver:'ClassicPlexElement'=None):
         """Click on a button.
 
@@ -118,18 +129,20 @@ class ClassicDriver(PlexDriver):
             driver (ClassicPlexElement, optional): The WebDriver to use as a root for searching for the button. Defaults to None.
         """
         driver = driver or self.driver
-        # Elements with <a><span> button structure
-        a_buttons = driver.find_elements(By.CLASS_NAME, 'Button')
-        # Elements with <ul><li> button structure
-        ul_buttons = driver.find_elements(By.CLASS_NAME, 'button')
-        buttons = a_buttons + ul_buttons
-        for b in buttons:
-            if b.get_property('textContent') == button_text:
-                self.debug_logger.debug(f'Button found with matching text: {button_text}')
-                b.click()
-                break
+        # Elements with <a><span> button structure, then elements with <ul><li> button structure
+        button_selectors = [(By.CLASS_NAME, 'Button'), (By.CLASS_NAME, 'button')]
+        try:
+            button = self.find_element_by_text(button_selectors, button_text, driver=driver)
+        except WebDriverException as e:
+            self.debug_logger.debug(f'Unable to match buttons with a script. Checking each button. {e}')
+            buttons = [b for selector in button_selectors for b in driver.find_elements(*selector)]
+            button = next((b for b in buttons if b.get_property('textContent') == button_text), None)
+        if button:
+            self.debug_logger.debug(f'Button found with matching text: {button_text}')
+            button.click()
 
 
+    @instrumented
     def login(self, username, password, company_code, pcn, test_db=True, headless=False):
         """Log in to Plex
 
@@ -146,11 +159,13 @@ class ClassicDriver(PlexDriver):
         """
         self._set_login_vars()
         super().login(username, password, company_code, pcn, test_db, headless)
-        self._classic_popup_handle()
-        self._login_validate()
-        self.pcn_switch(self.pcn)
+        if not self.session_restored:
+            self._classic_popup_handle()
+            self._login_validate()
+            self.pcn_switch(self.pcn)
         self.token_get()
         self.first_login = False
+        self.save_session()
         return (self.driver, self.url_comb)
     
 
@@ -241,5 +256,6 @@ class ClassicPlexElement(PlexElement):
     def __init__(self, webelement, parent):
         super().__init__(webelement, parent)
 
+    @instrumented
     def sync_picker(self, text_content, clear=False, date=False):
         """TODO - Create this function."""
\ No newline at end of file
@@ -1,8 +1,10 @@
 from warnings import warn
 
 import os
+import json
 import time
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from typing import Literal, Union
 from pathlib import Path
 
@@ -16,7 +18,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
     StaleElementReferenceException,
-    NoSuchElementException
+    NoSuchElementException,
+    WebDriverException
     )
 
 from selenium.webdriver.remote.webelement import WebElement
@@ -28,6 +31,10 @@ from pmc_automation_tools.common.utils import (
     debug_logger,
     create_batch_folder,
     )
+from pmc_automation_tools.driver.instrumentation import (
+    DriverInstrumentation,
+    instrumented,
+    )
 VALID_ENVIRONMENTS = {'ux', 'classic'}
 
 
@@ -43,6 +50,31 @@ BANNER_SELECTOR = (By.CLASS_NAME, 'plex-banner')
 
 SIGNON_URL_PARTS = {'/LAUNCHPAGE', '/MENUCUSTOMER.ASPX', '/MENU.ASPX'}
 
+# URL patterns blocked for each resource type when using the performance profile.
+# Each pattern is also blocked with a query string. e.g. logo.png?v=123
+RESOURCE_URL_PATTERNS = {
+    'image': ('*.png', '*.jpg', '*.jpeg', '*.gif', '*.bmp', '*.ico', '*.webp', '*.svg'),
+    'font': ('*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'),
+    'media': ('*.mp4', '*.webm', '*.ogg', '*.mp3', '*.wav'),
+    'stylesheet': ('*.css',),
+}
+# Default performance profile. Pass a dict to the performance_profile driver option to override any of the keys.
+PERFORMANCE_PROFILE = {
+    'page_load_strategy': 'eager',
+    'block_resources': ('image', 'media'),
+    'block_urls': ('*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*newrelic.com*', '*nr-data.net*', '*pendo.io*'),
+    'arguments': (
+        '--disable-extensions',
+        '--disable-background-networking',
+        '--disable-component-update',
+        '--disable-default-apps',
+        '--disable-sync',
+        '--no-first-run',
+        '--no-default-browser-check',
+        '--disable-features=Translate,OptimizationHints,MediaRouter',
+    ),
+}
+
 VISIBLE = 10
 INVISIBLE = 20
 CLICKABLE = 30
@@ -61,6 +93,201 @@ _wait_untils = {
     # EXISTS : None
 }
 
+# Finds the first element matching any of the selectors where one of the properties equals the text.
+# Runs in the browser so matching a list of elements is a single WebDriver call.
+# Like Selenium's get_attribute, the attribute is used when the element has no such property and values are compared as strings.
+FIND_BY_TEXT_SCRIPT = '''
+var root = arguments[0] || document, selectors = arguments[1], text = arguments[2],
+    props = arguments[3], closest = arguments[4], normalize = arguments[5];
+function norm(v) { v = String(v); return normalize ? v.split(/\\s+/).filter(Boolean).join(' ') : v; }
+for (var s = 0; s < selectors.length; s++) {
+    var els;
+    if (selectors[s][0] === 'xpath') {
+        var snapshot = document.evaluate(selectors[s][1], root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        els = [];
+        for (var n = 0; n < snapshot.snapshotLength; n++) { els.push(snapshot.snapshotItem(n)); }
+    } else {
+        els = root.querySelectorAll(selectors[s][1]);
+    }
+    for (var i = 0; i < els.length; i++) {
+        for (var p = 0; p < props.length; p++) {
+            var v = els[i][props[p]];
+            if (v === undefined) { v = els[i].getAttribute(props[p]); }
+            if (v !== undefined && v !== null && norm(v) === text) {
+                return closest ? els[i].closest(closest) : els[i];
+            }
+        }
+    }
+}
+return null;
+'''
+
+# Shared by the wait scripts. An element is visible if it is displayed and has a layout box.
+VISIBLE_FUNCTION = '''
+function visible(el) {
+    var style = getComputedStyle(el);
+    return style.display !== 'none' && style.visibility !== 'hidden' && el.getClientRects().length > 0;
+}
+'''
+# Counts in-flight XHR/fetch requests for wait_for_page_ready. Safe to run more than once per page.
+PAGE_READY_INSTALL_SCRIPT = '''
+(function() {
+    if (window.__pmcPageReady) { return; }
+    var state = window.__pmcPageReady = {pending: 0, started: 0};
+    function finished() { state.pending = Math.max(0, state.pending - 1); }
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        state.pending++;
+        state.started++;
+        var counted = true;
+        this.addEventListener('loadend', function() { if (counted) { counted = false; finished(); } });
+        try {
+            return send.apply(this, arguments);
+        } catch (e) {
+            if (counted) { counted = false; finished(); }
+            throw e;
+        }
+    };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function() {
+            state.pending++;
+            state.started++;
+            try {
+                return fetch.apply(this, arguments).finally(finished);
+            } catch (e) {
+                finished();
+                throw e;
+            }
+        };
+    }
+})();
+'''
+# Resolves once the document is loaded, no requests are in flight and the busy indicator is hidden for the quiet period.
+# Until a request starts or the page is seen busy, the quiet period isn't counted for the first activity milliseconds.
+# This keeps the wait from finishing before the request or busy indicator triggered by a click has started.
+# A MutationObserver re-checks as soon as the DOM changes so the wait isn't bound to the poll interval.
+PAGE_READY_WAIT_SCRIPT = 'var instrumented = !!window.__pmcPageReady;' + PAGE_READY_INSTALL_SCRIPT + VISIBLE_FUNCTION + '''
+var selector = arguments[0], quiet = arguments[1], timeout = arguments[2], poll = arguments[3], activity = arguments[4],
+    done = arguments[arguments.length - 1], state = window.__pmcPageReady, started = state.started || 0,
+    start = Date.now(), idleSince = null, active = false, finished = false, timer = null, observer = null;
+function busy() {
+    if (document.readyState !== 'complete' || state.pending > 0) { return true; }
+    if (!selector) { return false; }
+    var els;
+    if (selector[0] === 'xpath') {
+        var snapshot = document.evaluate(selector[1], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        els = [];
+        for (var n = 0; n < snapshot.snapshotLength; n++) { els.push(snapshot.snapshotItem(n)); }
+    } else {
+        els = document.querySelectorAll(selector[1]);
+    }
+    for (var i = 0; i < els.length; i++) {
+        if (visible(els[i])) { return true; }
+    }
+    return false;
+}
+function finish(ready) {
+    if (finished) { return; }
+    finished = true;
+    clearTimeout(timer);
+    if (observer) { observer.disconnect(); }
+    done({ready: ready, waited: Date.now() - start, instrumented: instrumented, active: active});
+}
+function check() {
+    if (finished) { return; }
+    var now = Date.now();
+    if (busy()) {
+        active = true;
+        idleSince = null;
+    } else if (idleSince === null) {
+        idleSince = now;
+    }
+    if ((state.started || 0) !== started) { active = true; }
+    var waiting = !active && now - start < activity;
+    if (!waiting && idleSince !== null && now - idleSince >= quiet) { return finish(true); }
+    if (now - start >= timeout) { return finish(false); }
+    clearTimeout(timer);
+    timer = setTimeout(check, idleSince === null || waiting ? poll : Math.min(poll, quiet - (now - idleSince)));
+}
+if (document.documentElement) {
+    observer = new MutationObserver(check);
+    observer.observe(document.documentElement, {subtree: true, childList: true, attributes: true, attributeFilter: ['class', 'style']});
+}
+check();
+'''
+
+# Waits for a visible banner with one of the expected classes. Hidden banners left from earlier actions are ignored.
+# Returns the banner class, matching class, text and the field errors in one payload.
+BANNER_WAIT_SCRIPT = VISIBLE_FUNCTION + '''
+var classes = arguments[0], appearTimeout = arguments[1], classTimeout = arguments[2],
+    done = arguments[arguments.length - 1], start = Date.now(), foundAt = null,
+    finished = false, timer = null, observer = null;
+function errors() {
+    var result = {}, labels = document.querySelectorAll('label.plex-error');
+    for (var i = 0; i < labels.length; i++) {
+        var source = document.getElementById(labels[i].getAttribute('for'));
+        result[source ? source.getAttribute('name') : labels[i].getAttribute('for')] = labels[i].textContent;
+    }
+    return result;
+}
+function visibleBanner() {
+    var banners = document.querySelectorAll('.plex-banner');
+    for (var i = 0; i < banners.length; i++) {
+        if (visible(banners[i])) { return banners[i]; }
+    }
+    return null;
+}
+function finish(payload) {
+    if (finished) { return; }
+    finished = true;
+    clearTimeout(timer);
+    if (observer) { observer.disconnect(); }
+    done(payload);
+}
+function check() {
+    if (finished) { return; }
+    var now = Date.now(), banner = visibleBanner();
+    if (!banner) {
+        if (now - start >= appearTimeout) { return finish({found: false}); }
+    } else {
+        var bannerClass = banner.getAttribute('class') || '', match = null;
+        for (var i = 0; i < classes.length; i++) {
+            if (bannerClass.indexOf(classes[i]) !== -1) { match = classes[i]; break; }
+        }
+        if (foundAt === null) { foundAt = now; }
+        if (match || now - foundAt >= classTimeout) {
+            return finish({found: true, banner_class: bannerClass, match: match, text: banner.textContent, errors: match ? errors() : {}});
+        }
+    }
+    clearTimeout(timer);
+    timer = setTimeout(check, 100);
+}
+observer = new MutationObserver(check);
+observer.observe(document.documentElement, {subtree: true, childList: true, attributes: true, attributeFilter: ['class', 'style']});
+check();
+'''
+
+_CSS_SELECTORS = {
+    By.CSS_SELECTOR: lambda v: v,
+    By.ID: lambda v: f'[id="{v}"]',
+    By.NAME: lambda v: f'[name="{v}"]',
+    By.CLASS_NAME: lambda v: '.' + v,
+    By.TAG_NAME: lambda v: v,
+}
+
+
+def _script_selector(by:str, value:str) -> Union[tuple[str, str], None]:
+    """
+    Convert a Selenium selector to a (type, selector) pair usable by FIND_BY_TEXT_SCRIPT.
+
+    Returns None for selector types that can't be evaluated in the script. e.g. link text
+    """
+    if by == By.XPATH:
+        return ('xpath', value)
+    css = _CSS_SELECTORS.get(by)
+    return ('css', css(value)) if css else None
+
 
 class PlexDriver(ABC):
     def __init__(self, environment: Literal['ux', 'classic'], *args, driver_type: Literal['edge', 'chrome']='edge', **kwargs):
@@ -71,6 +298,14 @@ class PlexDriver(ABC):
         self.debug = kwargs.get('debug', False)
         self.debug_level = kwargs.get('debug_level', 0)
         self.debug_logger = debug_logger(self.debug_level)
+        self.page_ready = kwargs.get('page_ready', False)
+        self.poll_frequency = kwargs.get('poll_frequency', 0.5)
+        self.session_file = kwargs.get('session_file', None)
+        self.profile_dir = kwargs.get('profile_dir', None)
+        self.session_restored = False
+        self._instrumentation = DriverInstrumentation() if kwargs.get('instrument', False) else None
+        # Sub classes set every keyword argument as an attribute again, so the resolved profile uses a private name.
+        self._performance_options = self._performance_profile(kwargs.get('performance_profile', False))
         self.environment = environment.lower()
         self.single_pcn = False
         self._set_login_vars()
@@ -125,7 +360,7 @@ class PlexDriver(ABC):
             driver = driver or self.driver
             element_condition = _wait_untils.get(type)
             if element_condition:
-                _elements = WebDriverWait(driver, timeout).until(element_condition((by, value)))
+                _elements = WebDriverWait(driver, timeout, poll_frequency=self.poll_frequency).until(element_condition((by, value)))
             element_class = element_class or PlexElement
             return [element_class(_el, self) for _el in _elements] #element_class(driver.find_element(by, value), self)
 
@@ -134,6 +369,7 @@ class PlexDriver(ABC):
                 return None
             raise
 
+    @instrumented
     def wait_for_element(self, selector:Union[tuple[str, str], str], *args, driver=None, timeout:int=15, type=VISIBLE, ignore_exception: bool=False, element_class:object=None) -> 'PlexElement':
         """Wait until an element meets specified criteria.
 
@@ -168,7 +404,7 @@ class PlexDriver(ABC):
             driver = driver or self.driver
             element_condition = _wait_until.get(type)
             if element_condition:
-                WebDriverWait(driver, timeout).until(element_condition((by, value)))
+                WebDriverWait(driver, timeout, poll_frequency=self.poll_frequency).until(element_condition((by, value)))
             element_class = element_class or PlexElement
             return element_class(driver.find_element(by, value), self)
 
@@ -177,22 +413,80 @@ class PlexDriver(ABC):
                 return None
             raise
     
+    def find_element_by_text(self, selectors:list[tuple[str, str]], text:str, driver=None, properties:tuple[str, ...]=('textContent',), closest:str=None, normalize:bool=False) -> Union[WebElement, None]:
+        """Find the first element matching any of the selectors with a property equal to the provided text.
+
+        The matching is done in the browser with a single script call instead of reading each element's property separately.
+
+        Args:
+            selectors (list[tuple[str, str]]): Selenium style element selectors. Searched in order.
+            text (str): Text to match.
+            driver (WebDriver|PlexElement, optional): root to search within. Defaults to None.
+            properties (tuple[str, ...], optional): DOM properties to compare with the text. Defaults to ('textContent',).
+            closest (str, optional): CSS selector of an ancestor to return instead of the matching element. Defaults to None.
+            normalize (bool, optional): Collapse repeated whitespace in the property values before comparing. Defaults to False.
+
+        Raises:
+            ValueError: A selector type can't be evaluated in the browser script. e.g. link text
+
+        Returns:
+            WebElement: matching element or None if there is no match.
+        """
+        script_selectors = [_script_selector(*selector) for selector in selectors]
+        if None in script_selectors:
+            raise ValueError(f'Selectors must be css, xpath, id, name, class name or tag name. Received {selectors}.')
+        root = driver if isinstance(driver, WebElement) else None
+        return self.driver.execute_script(FIND_BY_TEXT_SCRIPT, root, script_selectors, text, list(properties), closest, normalize)
+
+
     def search_for_element(self, selector, match_value, driver=None, ignore_exception=False):
         try:
             driver = driver or self.driver
-            _el = driver.find_elements(*selector)
-            for e in _el:
-                val = e.get_attribute('value')
-                tex = e.get_attribute('textContent')
-                if match_value == val or match_value == tex:
-                    return e
-            raise NoSuchElementException('No element could be found with the provided selector and match value.')
+            try:
+                element = self.find_element_by_text([selector], match_value, driver=driver, properties=('value', 'textContent'))
+            except (ValueError, WebDriverException) as e:
+                self.debug_logger.debug(f'Unable to match elements with a script. Checking each element. {e}')
+                element = next((e for e in driver.find_elements(*selector)
+                                if match_value in (e.get_attribute('value'), e.get_attribute('textContent'))), None)
+            if element is None:
+                raise NoSuchElementException('No element could be found with the provided selector and match value.')
+            return element
         except (TimeoutException, StaleElementReferenceException, NoSuchElementException):
             if ignore_exception:
                 return None
             raise
 
+    @instrumented
     def wait_for_banner(self) -> None:
+        try:
+            payload = self._read_banner(10)
+        except WebDriverException as e:
+            self.debug_logger.debug(f'Unable to wait for the banner with a script. Checking the banner element. {e}')
+            return self._wait_for_banner_element()
+        if not payload.get('found'):
+            raise UpdateError('No banner detected.')
+        banner_type = BANNER_CLASSES.get(payload['match'])
+        if not banner_type:
+            raise UpdateError(f'Unexpected banner type detected. Found {payload["banner_class"]}. Expected one of {list(BANNER_CLASSES.keys())}')
+        if banner_type != BANNER_SUCCESS:
+            raise UpdateError(payload['text'])
+
+
+    def _read_banner(self, timeout:float, appear_timeout:float=15) -> dict:
+        """Wait in the browser for the banner to appear with an expected class.
+
+        Args:
+            timeout (float): Seconds to wait for an expected banner class after the banner appears.
+            appear_timeout (float, optional): Seconds to wait for the banner to appear. Defaults to 15.
+
+        Returns:
+            dict: found, banner_class, match (matching BANNER_CLASSES key), text and errors (field name: error text).
+        """
+        self._ensure_script_timeout(appear_timeout + timeout)
+        return self.driver.execute_async_script(BANNER_WAIT_SCRIPT, list(BANNER_CLASSES), int(appear_timeout * 1000), int(timeout * 1000))
+
+
+    def _wait_for_banner_element(self) -> None:
         try:
             loop = 0
             while loop <= 10:
@@ -217,6 +511,14 @@ class PlexDriver(ABC):
             banner_text = banner.get_property('textContent')
             raise UpdateError(banner_text)
 
+
+    def _ensure_script_timeout(self, seconds:float) -> None:
+        # Async scripts fail once the driver's script timeout (30s by default) is reached.
+        if seconds + 1 > getattr(self, '_script_timeout', 30):
+            self._script_timeout = seconds + 1
+            self.driver.set_script_timeout(self._script_timeout)
+
+    @instrumented
     def wait_for_gears(self, selector, loading_timeout=10):
         """Wait for the spinning gears image to appear and disappear
 
@@ -230,13 +532,64 @@ class PlexDriver(ABC):
         Arg:
             selector (tuple[str, str]): Selenium style element selector e.g. (By.NAME, 'ElementName')
             loading_timeout (int, optional): Time to wait until the gears disappear after being detected. Defaults to 10.
+
+        If the driver was created with page_ready=True, wait_for_page_ready is used instead.
         """
+        if self.page_ready:
+            # Like the gears check below, give the click up to a second to start a request or show the gears.
+            PlexDriver.wait_for_page_ready(self, selector, timeout=loading_timeout, activity_timeout=1)
+            return
         gears_visible = False
         gears_visible = self.wait_for_element(selector, type=VISIBLE, timeout=1, ignore_exception=True)
         timeout = loading_timeout if gears_visible else 1
         self.debug_logger.debug(f'Timeout for invisible is {timeout}.')
         self.wait_for_element(selector, type=INVISIBLE, timeout=timeout, ignore_exception=True)
 
+    def wait_for_page_ready(self, selector:tuple[str, str]=None, timeout:float=10, quiet_period:float=0.1, poll_frequency:float=0.05, activity_timeout:float=0) -> bool:
+        """Wait until the page is idle.
+
+        The page is idle once the document has loaded, there are no XHR/fetch requests in flight, and no element matching the selector is visible for the quiet period.
+        The check runs inside the browser and returns as soon as the page is idle instead of waiting for fixed timeouts.
+
+        Requests are counted from the time the instrumentation is added to the page. When page_ready=True, the instrumentation is added to every new document through the DevTools protocol. Otherwise it is added on the first wait.
+
+        Args:
+            selector (tuple[str, str], optional): Selenium style selector for the busy indicator. Defaults to None.
+            timeout (float, optional): Seconds to wait before giving up. Defaults to 10.
+            quiet_period (float, optional): Seconds the page has to stay idle. Defaults to 0.1.
+            poll_frequency (float, optional): Seconds between checks in the browser. Defaults to 0.05.
+            activity_timeout (float, optional): Seconds to wait for a request to start or the busy indicator to show before the quiet period is counted.
+                Use after a click so the wait doesn't finish before the page reacts. The page is treated as idle after this time if nothing happens. Defaults to 0.
+
+        Returns:
+            bool: True if the page became idle before the timeout.
+        """
+        script_selector = _script_selector(*selector) if selector else None
+        end = time.monotonic() + timeout
+        self._ensure_script_timeout(timeout)
+        while True:
+            remaining = max(0, end - time.monotonic())
+            try:
+                result = self.driver.execute_async_script(PAGE_READY_WAIT_SCRIPT, script_selector, int(quiet_period * 1000), int(remaining * 1000), int(poll_frequency * 1000), int(activity_timeout * 1000))
+                self.debug_logger.debug(f'Page ready: {result}.')
+                return bool(result and result.get('ready'))
+            except WebDriverException as e:
+                # The document was replaced while waiting. Wait on the new document. The navigation counts as activity.
+                if time.monotonic() >= end:
+                    self.debug_logger.debug(f'Page did not become ready. {e}')
+                    return False
+                activity_timeout = 0
+                time.sleep(poll_frequency)
+
+
+    def _install_page_ready(self, driver) -> None:
+        try:
+            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': PAGE_READY_INSTALL_SCRIPT})
+        except (AttributeError, WebDriverException) as e:
+            self.debug_logger.debug(f'Unable to add page ready script to new documents. It will be added on the first wait. {e}')
+
+
+    @instrumented
     def login(self, username, password, company_code, pcn, test_db=True, headless=False):
         """Log in to Plex
 
@@ -257,6 +610,8 @@ class PlexDriver(ABC):
         else:
             self.pcn_name = self.pcn
         self.driver = self._driver_setup(self.driver_type)
+        if self._restore_session():
+            return
 
         db = self.plex_test if self.test_db else self.plex_prod
         self.driver.get(f'https://{db}{self.plex_main}{self.sso}')
@@ -298,11 +653,130 @@ class PlexDriver(ABC):
         self.first_login = True
 
 
+    def save_session(self, session_file:Union[str, Path]=None) -> None:
+        """Save the browser cookies and current URL so the next run can skip the login.
+
+        Args:
+            session_file (str|Path, optional): File to save the session to. Defaults to the session_file driver option.
+        """
+        session_file = session_file or self.session_file
+        if not session_file:
+            return
+        session = {
+            'environment': self.environment,
+            'test_db': self.test_db,
+            'pcn': self.pcn,
+            'url': self.driver.current_url,
+            'cookies': self.driver.get_cookies(),
+            'saved': time.time(),
+        }
+        tmp_file = f'{session_file}.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(session, f)
+        os.replace(tmp_file, session_file)
+        self.debug_logger.debug(f'Saved browser session to {session_file}.')
+
+
+    def _restore_session(self) -> bool:
+        """Restore a saved session and validate it with one navigation.
+
+        Returns:
+            bool: True if the saved session is still logged in.
+        """
+        self.session_restored = False
+        if not self.session_file or not os.path.exists(self.session_file):
+            return False
+        try:
+            with open(self.session_file, 'r', encoding='utf-8') as f:
+                session = json.load(f)
+        except (OSError, ValueError) as e:
+            self.debug_logger.debug(f'Unable to read the session file. {e}')
+            return False
+        if (session.get('environment'), session.get('test_db'), str(session.get('pcn'))) != (self.environment, self.test_db, str(self.pcn)):
+            self.debug_logger.debug('Saved session is for a different environment, database or PCN.')
+            return False
+        url = session['url']
+        self._add_session_cookies(url, session.get('cookies', []))
+        self.driver.get(url)
+        # Expired sessions are redirected to the sign on pages.
+        if self.driver.current_url.split('?')[0].upper() != url.split('?')[0].upper():
+            self.debug_logger.debug(f'Saved session is no longer valid. Redirected to {self.driver.current_url}.')
+            self.driver.delete_all_cookies()
+            return False
+        self.token_get()
+        self.first_login = False
+        self.session_restored = True
+        self.debug_logger.debug('Restored saved browser session.')
+        return True
+
+
+    def _add_session_cookies(self, url:str, cookies:list[dict]) -> None:
+        cdp_cookies = []
+        for cookie in cookies:
+            cdp_cookie = {k: cookie[k] for k in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite') if k in cookie}
+            if 'expiry' in cookie:
+                cdp_cookie['expires'] = cookie['expiry']
+            cdp_cookies.append(cdp_cookie)
+        try:
+            # Cookies for any domain can be set without loading a page first.
+            self.driver.execute_cdp_cmd('Network.setCookies', {'cookies': cdp_cookies})
+            return
+        except (AttributeError, WebDriverException) as e:
+            self.debug_logger.debug(f'Unable to set cookies through the browser protocol. Adding cookies for the session domain. {e}')
+        url_split = url.split('/')
+        self.driver.get(f'{url_split[0]}//{url_split[2]}/')
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except WebDriverException:
+                pass
+
+
     def _driver_setup(self, type):
         if type == 'edge':
-            return self._edge_setup()
-        if type == 'chrome':
-            return self._chrome_setup()
+            driver = self._edge_setup()
+        elif type == 'chrome':
+            driver = self._chrome_setup()
+        else:
+            return None
+        if self._instrumentation:
+            driver.execute = self._instrumentation.wrap_execute(driver.execute)
+        if self.page_ready:
+            self._install_page_ready(driver)
+        if self._performance_options:
+            self._block_urls(driver)
+        return driver
+
+
+    def _performance_profile(self, profile:Union[bool, dict]) -> Union[dict, None]:
+        if not profile:
+            return None
+        profile = {**PERFORMANCE_PROFILE, **(profile if isinstance(profile, dict) else {})}
+        unknown = set(profile['block_resources']) - set(RESOURCE_URL_PATTERNS)
+        if unknown:
+            raise ValueError(f'Unsupported resource types {unknown}. Expected any of {list(RESOURCE_URL_PATTERNS)}.')
+        return profile
+
+
+    def _apply_performance_profile(self, options) -> None:
+        options.page_load_strategy = self._performance_options['page_load_strategy']
+        for argument in self._performance_options['arguments']:
+            options.add_argument(argument)
+
+
+    def _block_urls(self, driver) -> None:
+        patterns = [variant
+                    for resource in self._performance_options['block_resources']
+                    for pattern in RESOURCE_URL_PATTERNS[resource]
+                    for variant in (pattern, f'{pattern}?*')]
+        patterns.extend(self._performance_options['block_urls'])
+        if not patterns:
+            return
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        except (AttributeError, WebDriverException) as e:
+            self.debug_logger.debug(f'Unable to block resources through the browser protocol. {e}')
 
 
     def _edge_setup(self):
@@ -312,6 +786,10 @@ class PlexDriver(ABC):
         if self.headless:
             self.debug_logger.debug(f'Running Edge in headless mode.')
             edge_options.add_argument("--headless")
+        if self.profile_dir:
+            edge_options.add_argument(f"--user-data-dir={os.path.abspath(self.profile_dir)}")
+        if self._performance_options:
+            self._apply_performance_profile(edge_options)
         edge_options.add_experimental_option("prefs", {
             "download.default_directory": f"{self.download_dir}",
             "download.prompt_for_download": False,
@@ -325,6 +803,10 @@ class PlexDriver(ABC):
         if self.headless:
             self.debug_logger.debug(f'Running chrome in headless mode.')
             chrome_options.add_argument("--headless")
+        if self.profile_dir:
+            chrome_options.add_argument(f"--user-data-dir={os.path.abspath(self.profile_dir)}")
+        if self._performance_options:
+            self._apply_performance_profile(chrome_options)
         chrome_options.add_experimental_option("prefs", {
             "download.default_directory": f"{self.download_dir}",
             "download.prompt_for_download": False,
@@ -332,6 +814,37 @@ class PlexDriver(ABC):
         return webdriver.Chrome(options=chrome_options)
 
 
+    @property
+    def instrumentation(self) -> Union[DriverInstrumentation, None]:
+        """Timings and WebDriver command counts collected when the driver is created with instrument=True."""
+        return self._instrumentation
+
+
+    def instrument_row(self, key=None):
+        """Group the instrumented steps for one record.
+
+        Each row is appended to instrumentation_rows.ndjson in the batch folder. Does nothing if instrumentation is not enabled.
+
+        Args:
+            key (Any, optional): Identifier written with the row. Defaults to None.
+        """
+        if not self._instrumentation:
+            return nullcontext()
+        return self._instrumentation.row(key, folder=getattr(self, 'batch_folder', None))
+
+
+    def write_instrumentation(self) -> Union[str, None]:
+        """Write the batch summary of step timings, histograms, WebDriver commands and slowest steps to the batch folder.
+
+        Returns:
+            str: path of instrumentation_summary.json or None if instrumentation is not enabled.
+        """
+        if not self._instrumentation:
+            return None
+        folder = getattr(self, 'batch_folder', None) or create_batch_folder(test=getattr(self, 'test_db', True))
+        return self._instrumentation.write_summary(folder)
+
+
     @abstractmethod
     def token_get(self):...
 
@@ -339,6 +852,7 @@ class PlexDriver(ABC):
     def _pcn_switch(self):...
 
     
+    @instrumented
     def pcn_switch(self, pcn):
         pcn = str(pcn)
         self.debug_logger.debug(f'Switching to PCN: {pcn}.')
@@ -352,19 +866,64 @@ class PlexDriver(ABC):
 class PlexElement(WebElement):
     """
     Subclass of Selenium WebElement with specialized functions for Plex elements.
+
+    Driver settings and helper methods are read from the parent PlexDriver instead of being copied to each element.
     """
+    __slots__ = ('_plex_driver',)
+
     def __init__(self, webelement, parent):
         super().__init__(webelement._parent, webelement._id)
-        self.debug = getattr(parent, 'debug', None)
-        self.debug_level = getattr(parent, 'debug_level', None)
-        self.debug_logger = debug_logger(self.debug_level)
-        self.batch_folder = getattr(parent, 'batch_folder', None)
-        self.test_db = getattr(parent, 'test_db', None)
-        self.driver = webelement._parent
-        self.wait_for_element = parent.wait_for_element
-        self.click_button = parent.click_button
-        self.wait_for_gears = parent.wait_for_gears
-        self.search_for_element = parent.search_for_element
+        self._plex_driver = parent
+
+
+    @property
+    def driver(self):
+        return self._parent
+
+
+    @property
+    def debug(self):
+        return getattr(self._plex_driver, 'debug', None)
+
+
+    @property
+    def debug_level(self):
+        return getattr(self._plex_driver, 'debug_level', None)
+
+
+    @property
+    def debug_logger(self):
+        return self._plex_driver.debug_logger
+
+
+    @property
+    def batch_folder(self):
+        return getattr(self._plex_driver, 'batch_folder', None)
+
+
+    @property
+    def test_db(self):
+        return getattr(self._plex_driver, 'test_db', None)
+
+
+    def wait_for_element(self, *args, **kwargs) -> 'PlexElement':
+        """See PlexDriver.wait_for_element."""
+        return self._plex_driver.wait_for_element(*args, **kwargs)
+
+
+    def click_button(self, button_text:str, driver=None) -> None:
+        """See PlexDriver.click_button. Searches the whole page unless a driver is provided. Send driver=self to search within this element."""
+        return self._plex_driver.click_button(button_text, driver=driver)
+
+
+    def wait_for_gears(self, *args, **kwargs) -> None:
+        """See PlexDriver.wait_for_gears."""
+        return self._plex_driver.wait_for_gears(*args, **kwargs)
+
+
+    def search_for_element(self, *args, **kwargs) -> WebElement:
+        """See PlexDriver.search_for_element."""
+        return self._plex_driver.search_for_element(*args, **kwargs)
 
 
     def screenshot(self):
@@ -374,15 +933,16 @@ class PlexElement(WebElement):
         element_id = self.id[-8:]
         session = self.parent.session_id[-5:]
         name = self.accessible_name or 'No_Name'
-        if not hasattr(self, 'batch_folder'):
-            self.batch_folder = create_batch_folder(test=self.test_db)
-        if not hasattr(self, 'screenshot_folder'):
-            self.screenshot_folder = os.path.join(self.batch_folder, 'screenshots')
-            os.makedirs(self.screenshot_folder, exist_ok=True)
-        filename = os.path.join(self.screenshot_folder, f"{session}_{element_id}_{name}_screenshot.png")
+        plex_driver = self._plex_driver
+        if not getattr(plex_driver, 'batch_folder', None):
+            plex_driver.batch_folder = create_batch_folder(test=self.test_db)
+        screenshot_folder = os.path.join(plex_driver.batch_folder, 'screenshots')
+        os.makedirs(screenshot_folder, exist_ok=True)
+        filename = os.path.join(screenshot_folder, f"{session}_{element_id}_{name}_screenshot.png")
         super().screenshot(filename)
 
     
+    @instrumented
     def sync_checkbox(self, bool_state:bool|int):
         """Sync a checkbox to the provided checked state
 
@@ -424,6 +984,7 @@ class PlexElement(WebElement):
         self.send_keys(Keys.TAB)
 
 
+    @instrumented
     def sync_textbox(self, text_content:str, clear:bool=False) -> Union[str|None]:
         """Sync a textbox with the provided value
 
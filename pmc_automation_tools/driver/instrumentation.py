@@ -0,0 +1,204 @@
+import os
+import json
+import heapq
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from itertools import count
+from time import perf_counter
+from typing import Callable
+
+
+# Upper bounds in seconds for the step duration histograms. The last bucket holds anything slower.
+HISTOGRAM_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+ROWS_FILE = 'instrumentation_rows.ndjson'
+SUMMARY_FILE = 'instrumentation_summary.json'
+
+
+def instrumented(func:Callable) -> Callable:
+    """Time the decorated driver or element method and count the WebDriver commands it sends.
+
+    Does nothing unless the driver was created with instrument=True.
+    """
+    name = func.__name__
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        instrumentation = getattr(getattr(self, '_plex_driver', self), '_instrumentation', None)
+        if instrumentation is None:
+            return func(self, *args, **kwargs)
+        with instrumentation.step(name):
+            return func(self, *args, **kwargs)
+    return wrapper
+
+
+class _StepStats():
+    __slots__ = ('count', 'total', 'max', 'commands', 'command_time', 'errors', 'histogram')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.commands = 0
+        self.command_time = 0.0
+        self.errors = 0
+        self.histogram = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+
+
+    def add(self, elapsed:float, commands:int, command_time:float, error:bool) -> None:
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        self.commands += commands
+        self.command_time += command_time
+        self.errors += error
+        self.histogram[bisect_left(HISTOGRAM_BUCKETS, elapsed)] += 1
+
+
+    def to_dict(self) -> dict:
+        labels = [f'<={b}s' for b in HISTOGRAM_BUCKETS] + [f'>{HISTOGRAM_BUCKETS[-1]}s']
+        return {
+            'count': self.count,
+            'total_seconds': round(self.total, 4),
+            'mean_seconds': round(self.total / self.count, 4) if self.count else 0,
+            'max_seconds': round(self.max, 4),
+            'commands': self.commands,
+            'commands_per_call': round(self.commands / self.count, 2) if self.count else 0,
+            'webdriver_seconds': round(self.command_time, 4),
+            'local_seconds': round(self.total - self.command_time, 4),
+            'errors': self.errors,
+            'histogram': {label: n for label, n in zip(labels, self.histogram) if n},
+        }
+
+
+class DriverInstrumentation():
+    """Collects timings and WebDriver command counts for driver actions.
+
+    Steps are the instrumented driver and element methods. Time spent waiting for WebDriver commands is reported separately from local time such as fixed sleeps.
+    Rows group the steps for one record. Each finished row is appended to instrumentation_rows.ndjson and write_summary() saves the batch summary.
+
+    Args:
+        top (int, optional): Number of slowest steps to keep. Defaults to 20.
+    """
+    def __init__(self, top:int=20):
+        self.top = top
+        self.steps = defaultdict(_StepStats)
+        self.commands = Counter()
+        self.command_time = defaultdict(float)
+        self.rows = 0
+        self.row_errors = 0
+        self._slowest = []
+        self._sequence = count()
+        self._stack = []
+        self._row = None
+        self._start = perf_counter()
+
+
+    def __repr__(self):
+        return f'DriverInstrumentation(steps={sum(s.count for s in self.steps.values())}, commands={sum(self.commands.values())}, rows={self.rows})'
+
+
+    def wrap_execute(self, execute:Callable) -> Callable:
+        """Wrap a WebDriver's execute method to count and time each command."""
+        @wraps(execute)
+        def instrumented_execute(driver_command, params=None):
+            start = perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self._command(driver_command, perf_counter() - start)
+        return instrumented_execute
+
+
+    def _command(self, name:str, elapsed:float) -> None:
+        self.commands[name] += 1
+        self.command_time[name] += elapsed
+        for step in self._stack:
+            step[2] += 1
+            step[3] += elapsed
+        if self._row is not None:
+            self._row['commands'] += 1
+            self._row['webdriver_seconds'] += elapsed
+
+
+    @contextmanager
+    def step(self, name:str):
+        # Overridden methods call their parent implementation. Only the outer call is recorded.
+        if self._stack and self._stack[-1][0] == name:
+            yield
+            return
+        step = [name, perf_counter(), 0, 0.0]
+        self._stack.append(step)
+        error = False
+        try:
+            yield
+        except Exception:
+            error = True
+            raise
+        finally:
+            self._stack.pop()
+            elapsed = perf_counter() - step[1]
+            self.steps[name].add(elapsed, step[2], step[3], error)
+            entry = (elapsed, next(self._sequence), name, self._row['row'] if self._row else None, step[2])
+            if len(self._slowest) < self.top:
+                heapq.heappush(self._slowest, entry)
+            else:
+                heapq.heappushpop(self._slowest, entry)
+            if self._row is not None and not self._stack:
+                self._row['steps'][name] += elapsed
+
+
+    @contextmanager
+    def row(self, key=None, folder:str=None):
+        """Group the steps for one record.
+
+        Args:
+            key (Any, optional): Identifier written with the row. e.g. the record's key field. Defaults to None.
+                The row file has the total and WebDriver seconds, command count, seconds per top level step and any error.
+            folder (str, optional): Folder for instrumentation_rows.ndjson. Rows aren't written if None. Defaults to None.
+        """
+        self._row = {'row': key, 'seconds': 0.0, 'commands': 0, 'webdriver_seconds': 0.0, 'steps': defaultdict(float), 'error': None}
+        start = perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self._row['error'] = f'{type(e).__name__}: {e}'
+            self.row_errors += 1
+            raise
+        finally:
+            row, self._row = self._row, None
+            row['seconds'] = round(perf_counter() - start, 4)
+            row['webdriver_seconds'] = round(row['webdriver_seconds'], 4)
+            row['steps'] = {name: round(seconds, 4) for name, seconds in row['steps'].items()}
+            self.rows += 1
+            if folder:
+                with open(os.path.join(folder, ROWS_FILE), 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(row, default=str) + '\n')
+
+
+    def summary(self) -> dict:
+        """Batch summary of the steps, commands and slowest steps."""
+        return {
+            'elapsed_seconds': round(perf_counter() - self._start, 4),
+            'rows': self.rows,
+            'row_errors': self.row_errors,
+            'commands': sum(self.commands.values()),
+            'webdriver_seconds': round(sum(self.command_time.values()), 4),
+            'steps': {name: stats.to_dict() for name, stats in sorted(self.steps.items(), key=lambda s: -s[1].total)},
+            'webdriver_commands': {name: {'count': n, 'seconds': round(self.command_time[name], 4)} for name, n in self.commands.most_common()},
+            'slowest_steps': [{'step': name, 'row': row, 'seconds': round(elapsed, 4), 'commands': commands}
+                              for elapsed, _, name, row, commands in sorted(self._slowest, reverse=True)],
+        }
+
+
+    def write_summary(self, folder:str) -> str:
+        """Write the batch summary to instrumentation_summary.json in the folder.
+
+        Returns:
+            str: path of the summary file.
+        """
+        out_file = os.path.join(folder, SUMMARY_FILE)
+        with open(out_file, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, indent=4, default=str)
+        return out_file
+
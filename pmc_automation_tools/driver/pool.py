@@ -0,0 +1,149 @@
+import os
+import time
+import multiprocessing
+from multiprocessing.util import Finalize
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from itertools import cycle, islice
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Union
+
+
+# Driver owned by the current worker process. Set by _init_worker.
+_worker_driver = None
+
+
+class DriverTaskResult(NamedTuple):
+    """Result of running the task for one record in a DriverPool worker."""
+    index: int
+    record: Any
+    result: Any
+    error: Union[str, None]
+    worker: int
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _quit_driver(pa) -> None:
+    driver = getattr(pa, 'driver', None)
+    if driver is None:
+        return
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+def _init_worker(driver_class, driver_kwargs:dict, credential_queue, login_kwargs:dict, setup:Callable) -> None:
+    global _worker_driver
+    credentials = credential_queue.get()
+    pa = driver_class(**driver_kwargs)
+    # Quit the browser when the worker process exits, including when login or setup fails.
+    Finalize(None, _quit_driver, args=(pa,), exitpriority=10)
+    if isinstance(credentials, dict):
+        pa.login(**credentials, **login_kwargs)
+    else:
+        pa.login(*credentials, **login_kwargs)
+    if setup:
+        setup(pa)
+    _worker_driver = pa
+
+
+def _run_task(task:Callable, item:tuple[int, Any]) -> DriverTaskResult:
+    index, record = item
+    start = time.perf_counter()
+    try:
+        result = task(_worker_driver, record)
+        error = None
+    except Exception as e:
+        # Exceptions are returned as text. Some driver exceptions can't be pickled back to the coordinator.
+        result = None
+        error = f'{type(e).__name__}: {e}'
+        _worker_driver.debug_logger.debug(f'Record {index} failed. {error}')
+    return DriverTaskResult(index, record, result, error, os.getpid(), time.perf_counter() - start)
+
+
+class DriverPool:
+    """Run screen automation tasks across several browser sessions in worker processes.
+
+    Each worker creates one driver, logs in once and then runs the task for the records it receives from the shared work queue.
+
+    Args:
+        driver_class (type): Driver class to create in each worker. e.g. UXDriver or ClassicDriver.
+        credentials (dict|tuple|list): login arguments. A dict of keyword arguments or a tuple of positional arguments for driver_class.login().
+            Send a list to log the workers in with different credentials. The list is cycled if there are more workers than credentials.
+        workers (int, optional): Number of browser sessions. Defaults to 4.
+        driver_kwargs (dict, optional): Keyword arguments for the driver class. Defaults to None.
+        login_kwargs (dict, optional): Additional keyword arguments for login. e.g. {'test_db': False, 'headless': True}. Defaults to None.
+        setup (Callable, optional): Function called with the driver after login. e.g. to navigate to the screen being updated. Defaults to None.
+
+    The task and setup functions are sent to the worker processes and must be defined at module level.
+    Scripts using the pool must be guarded with if __name__ == '__main__': on Windows.
+    """
+    def __init__(self, driver_class:type, credentials:Union[dict, tuple, list], workers:int=4, driver_kwargs:dict=None, login_kwargs:dict=None, setup:Callable=None):
+        self.driver_class = driver_class
+        self.credentials = credentials if isinstance(credentials, list) else [credentials]
+        if not self.credentials:
+            raise ValueError('At least one set of login credentials is required.')
+        self.workers = workers
+        self.driver_kwargs = driver_kwargs or {}
+        self.login_kwargs = login_kwargs or {}
+        self.setup = setup
+        self._executor = None
+
+
+    def __enter__(self):
+        self.start()
+        return self
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+    def start(self) -> None:
+        """Start the worker processes. Each worker logs in when it receives its first record."""
+        if self._executor:
+            return
+        context = multiprocessing.get_context()
+        credential_queue = context.Queue()
+        for credentials in islice(cycle(self.credentials), self.workers):
+            credential_queue.put(credentials)
+        self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                             mp_context=context,
+                                             initializer=_init_worker,
+                                             initargs=(self.driver_class, self.driver_kwargs, credential_queue, self.login_kwargs, self.setup))
+
+
+    def close(self) -> None:
+        """Wait for running tasks and close the browser sessions."""
+        if self._executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+    def map(self, task:Callable[[Any, Any], Any], records:Iterable, ordered:bool=True) -> Iterator[DriverTaskResult]:
+        """Run the task for each record.
+
+        Args:
+            task (Callable): Function called as task(driver, record) in a worker. The return value must be picklable.
+            records (Iterable): Records to process. e.g. rows from read_updated() or iter_updated().
+            ordered (bool, optional): Yield the results in record order. Otherwise yield each result as it finishes. Defaults to True.
+
+        Yields:
+            DriverTaskResult: index, record, result, error, worker process id and elapsed seconds for each record.
+                Errors raised by the task are returned in the result instead of stopping the other records.
+
+        Raises:
+            BrokenProcessPool: A worker failed to start. e.g. the login failed.
+        """
+        self.start()
+        run = partial(_run_task, task)
+        if ordered:
+            yield from self._executor.map(run, enumerate(records))
+        else:
+            futures = [self._executor.submit(run, item) for item in enumerate(records)]
+            for future in as_completed(futures):
+                yield future.result()
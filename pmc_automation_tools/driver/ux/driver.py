@@ -1,4 +1,4 @@
-from typing import Literal, Union
+from typing import Literal, Union, Any
 from pmc_automation_tools.driver.common import (
     PlexDriver,
     PlexElement,
@@ -6,16 +6,18 @@ from pmc_automation_tools.driver.common import (
     INVISIBLE,
     CLICKABLE,
     EXISTS,
-    SIGNON_URL_PARTS
+    SIGNON_URL_PARTS,
+    instrumented
     )
 from selenium.common.exceptions import (
     TimeoutException,
     StaleElementReferenceException,
-    NoSuchElementException
+    NoSuchElementException,
+    WebDriverException
     )
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import Select
+from selenium.webdriver.support.ui import Select, WebDriverWait
 from pmc_automation_tools.common.exceptions import (
     UpdateError,
     NoRecordError,
@@ -24,6 +26,7 @@ from pmc_automation_tools.common.exceptions import (
     GridRowError
     )
 import time
+from urllib.parse import urlsplit, parse_qs
 BANNER_SUCCESS = 1
 BANNER_WARNING = 2
 BANNER_ERROR = 3
@@ -35,6 +38,233 @@ BANNER_CLASSES = {
 BANNER_SELECTOR = (By.CLASS_NAME, 'plex-banner')
 PLEX_GEARS_SELECTOR = (By.XPATH, '//i[@class="plex-waiting-spinner"]')
 UX_INVALID_PCN_MESSAGE = '__MESSAGE=YOU+WERE+REDIRECTED+TO+YOUR+LANDING+COMPANY'
+# Returns the visible text of the selected option and the first option with matching visible text.
+# option.text strips and collapses whitespace the same way as Selenium's visible text.
+SELECT_OPTION_SCRIPT = '''
+var select = arguments[0], text = arguments[1], options = select.options, match = null;
+for (var i = 0; i < options.length; i++) {
+    if (options[i].text === text) { match = options[i]; break; }
+}
+var selected = select.selectedIndex >= 0 ? options[select.selectedIndex].text : null;
+return [selected, match];
+'''
+
+# Column titles for the first grid header. Index matches the data-col-index of the row cells.
+GRID_HEADERS_FUNCTION = '''
+function gridHeaders(root) {
+    var thead = root.querySelector('thead');
+    if (!thead) { return null; }
+    var cells = thead.querySelectorAll('.plex-grid-header-cell'), headers = [];
+    for (var i = 0; i < cells.length; i++) {
+        var abbr = cells[i].querySelector('abbr');
+        headers.push(abbr ? abbr.textContent : null);
+    }
+    return headers;
+}
+'''
+GRID_COLUMNS_SCRIPT = GRID_HEADERS_FUNCTION + '''
+return gridHeaders(arguments[0] || document);
+'''
+# Reads the column titles and every selectable grid row. Optionally scrolls the grid to load virtualized rows.
+GRID_ROWS_SCRIPT = GRID_HEADERS_FUNCTION + '''
+var root = arguments[0] || document, scroll = arguments[1], delay = arguments[2], maxScrolls = arguments[3],
+    done = arguments[arguments.length - 1], rowSelector = 'tr[class*="plex-grid-row selectable"]',
+    headers = gridHeaders(root), rows = [], seen = {};
+// Rows are identified by their index or data attributes. Rows without either are identified by their content.
+// Row elements are reused for other rows while the grid scrolls, so the element can't identify a row.
+function rowKey(tr, row) {
+    var index = tr.getAttribute('aria-rowindex') || tr.getAttribute('data-row-index') || tr.getAttribute('data-index');
+    if (index !== null) { return 'index:' + index; }
+    if (Object.keys(row.attributes).length) { return 'data:' + JSON.stringify(row.attributes); }
+    return 'content:' + JSON.stringify([row.cells, row.links]);
+}
+function collect() {
+    var trs = root.querySelectorAll(rowSelector);
+    for (var i = 0; i < trs.length; i++) {
+        var tr = trs[i], cells = {}, links = {}, attributes = {};
+        var tds = tr.querySelectorAll('td[data-col-index]');
+        for (var c = 0; c < tds.length; c++) {
+            var index = tds[c].getAttribute('data-col-index'), a = tds[c].querySelector('a');
+            cells[index] = tds[c].textContent;
+            if (a) { links[index] = a.getAttribute('href'); }
+        }
+        for (var k in tr.dataset) { attributes[k] = tr.dataset[k]; }
+        var row = {attributes: attributes, cells: cells, links: links};
+        if (scroll) {
+            var key = rowKey(tr, row);
+            if (seen[key]) { continue; }
+            seen[key] = true;
+        }
+        rows.push(row);
+    }
+}
+function container() {
+    var el = root.querySelector(rowSelector);
+    while (el && el !== document.body) {
+        var overflow = getComputedStyle(el).overflowY;
+        if ((overflow === 'auto' || overflow === 'scroll') && el.scrollHeight > el.clientHeight) { return el; }
+        el = el.parentElement;
+    }
+    return document.scrollingElement;
+}
+collect();
+if (!scroll) { done([headers, rows]); return; }
+var box = container(), start = box.scrollTop, count = 0;
+function step() {
+    var previous = box.scrollTop;
+    box.scrollTop = previous + box.clientHeight;
+    if (box.scrollTop === previous || count++ >= maxScrolls) {
+        box.scrollTop = start;
+        done([headers, rows]);
+        return;
+    }
+    setTimeout(function() { collect(); step(); }, delay);
+}
+step();
+'''
+# Rows with a cell at the column index matching the value.
+# Returns null if the column titles don't match the expected titles so they can be read again.
+GRID_MATCH_ROWS_SCRIPT = GRID_HEADERS_FUNCTION + '''
+var root = arguments[0] || document, column = String(arguments[1]), value = arguments[2], expected = arguments[3], matches = [];
+if (expected) {
+    var headers = gridHeaders(root) || [];
+    if (headers.length !== expected.length) { return null; }
+    for (var h = 0; h < headers.length; h++) {
+        if (headers[h] !== expected[h]) { return null; }
+    }
+}
+var tds = root.querySelectorAll('tr[class*="plex-grid-row selectable"] > td[data-col-index="' + column + '"]');
+for (var i = 0; i < tds.length; i++) {
+    if (tds[i].textContent === value) { matches.push(tds[i].parentElement); }
+}
+return matches;
+'''
+# First popup picker row with a column matching the text and the number of rows.
+POPUP_MATCH_SCRIPT = '''
+var popup = arguments[0], text = arguments[1], delimiter = arguments[2];
+var rows = popup.querySelectorAll('.plex-grid-row');
+for (var i = 0; i < rows.length; i++) {
+    if (rows[i].innerText.split(delimiter).indexOf(text) !== -1) { return [rows[i], rows.length]; }
+}
+return [null, rows.length];
+'''
+# Current values of form fields by name.
+# Pickers are inputs following a selected items element, or any name in the pickers list.
+FORM_READ_SCRIPT = '''
+var root = arguments[0] || document, names = arguments[1], pickers = arguments[2], fields = {};
+function previous(el, className) {
+    var sibling = el.previousElementSibling;
+    while (sibling) {
+        if (sibling.classList.contains(className)) { return sibling; }
+        sibling = sibling.previousElementSibling;
+    }
+    return null;
+}
+for (var i = 0; i < names.length; i++) {
+    var el = root.querySelector('[name="' + CSS.escape(names[i]) + '"]');
+    if (!el) { fields[names[i]] = null; continue; }
+    var tag = el.tagName.toLowerCase(), selected = previous(el, 'plex-picker-selected-items'), kind, value;
+    if (tag === 'select') {
+        kind = 'select';
+        value = el.selectedIndex >= 0 ? el.options[el.selectedIndex].text : '';
+    } else if (el.type === 'checkbox' || el.type === 'radio') {
+        kind = 'checkbox';
+        value = el.checked;
+    } else if (selected || previous(el, 'plex-picker-item') || el.className === 'input-sm' || pickers.indexOf(names[i]) !== -1) {
+        kind = 'picker';
+        var item = selected ? selected.querySelector('.plex-picker-item-text') : null;
+        value = item ? item.textContent : '';
+    } else {
+        kind = 'text';
+        value = el.value;
+    }
+    fields[names[i]] = {element: el, kind: kind, value: value};
+}
+return fields;
+'''
+# Applies text, checkbox and select values with the events a user edit would fire.
+# Returns the names of select fields without a matching option.
+FORM_APPLY_SCRIPT = '''
+var changes = arguments[0], missing = [];
+function fire(el, type) { el.dispatchEvent(new Event(type, {bubbles: true})); }
+for (var i = 0; i < changes.length; i++) {
+    var name = changes[i][0], el = changes[i][1], kind = changes[i][2], value = changes[i][3];
+    el.focus();
+    if (kind === 'checkbox') {
+        if (el.checked !== value) { el.click(); }
+    } else if (kind === 'select') {
+        var index = -1;
+        for (var o = 0; o < el.options.length; o++) {
+            if (el.options[o].text === value) { index = o; break; }
+        }
+        if (index === -1) { missing.push(name); el.blur(); continue; }
+        el.selectedIndex = index;
+        fire(el, 'input');
+        fire(el, 'change');
+    } else {
+        var proto = el.tagName.toLowerCase() === 'textarea' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+        fire(el, 'input');
+        fire(el, 'change');
+    }
+    el.blur();
+}
+return missing;
+'''
+
+
+class UXGrid():
+    """
+    Snapshot of a UX grid read with UXDriver.read_grid.
+
+    Attributes:
+        headers (list[str|None]): column titles by column index. None for columns without a title.
+        rows (list[dict]): rows with attributes (tr data attributes), cells and links (cell text and hyperlinks by column index).
+    """
+    def __init__(self, headers:list, rows:list[dict]):
+        self.headers = headers or []
+        self.rows = [
+            {
+                'attributes': r['attributes'],
+                'cells': {int(k): v for k, v in r['cells'].items()},
+                'links': {int(k): v for k, v in r['links'].items()},
+            }
+            for r in rows
+        ]
+
+
+    def __repr__(self):
+        return f"UXGrid(columns={len(self.headers)}, rows={len(self.rows)})"
+
+
+    def __len__(self):
+        return len(self.rows)
+
+
+    def column_index(self, column:Union[str, int]) -> int:
+        """Index of a column by title. Integers are returned as is.
+
+        Raises:
+            GridColumnError: No column matching the title.
+        """
+        if isinstance(column, int):
+            return column
+        try:
+            return self.headers.index(column)
+        except ValueError:
+            raise GridColumnError(f'No column detected in the table matching provided value: {column}.') from None
+
+
+    def find_rows(self, value:str, column:Union[str, int]) -> list[dict]:
+        """Rows with the cell text in the column matching the value."""
+        index = self.column_index(column)
+        return [r for r in self.rows if r['cells'].get(index) == value]
+
+
+    def records(self) -> list[dict[Any, str]]:
+        """Cell text for each row keyed by column title, or column index for columns without a title."""
+        names = {i: h if h else i for i, h in enumerate(self.headers)}
+        return [{names.get(i, i): v for i, v in r['cells'].items()} for r in self.rows]
 
 
 class UXDriver(PlexDriver):
@@ -42,7 +272,11 @@ class UXDriver(PlexDriver):
         super().__init__(environment='ux', *args, driver_type=driver_type, **kwargs)
         for k, v in kwargs.items():
             setattr(self, k, v)
+        self._grid_columns = {}
+        # How picker values were resolved during the session. (field name, text) -> 'direct' or 'popup'
+        self._picker_cache = {}
 
+    @instrumented
     def wait_for_element(self, selector, *args, driver:Union['UXDriver','UXPlexElement']=None, timeout=15, type=VISIBLE, ignore_exception=False) -> 'UXPlexElement':
         return super().wait_for_element(selector, *args, driver=driver, timeout=timeout, type=type, ignore_exception=ignore_exception, element_class=UXPlexElement)
 
@@ -51,9 +285,12 @@ class UXDriver(PlexDriver):
         return super().wait_for_elements(selector, *args, driver=driver, timeout=timeout, type=type, ignore_exception=ignore_exception, element_class=UXPlexElement)
 
 
+    @instrumented
     def wait_for_banner(self, timeout:int=10, ignore_exception:bool=False) -> None:
         """Wait for the banner to appear and handle success/error/warning messages.
 
+        The banner is detected in the browser as soon as it renders. The banner text and field errors are returned in the same call.
+
         Args:
             timeout (int, optional): How long to wait for the banner before throwing an exception. Defaults to 10.
             ignore_exception (bool, optional): Don't re-raise an exception if the banner is not found. Defaults to False.
@@ -62,7 +299,26 @@ class UXDriver(PlexDriver):
             UpdateError: Unexpected banner type.
             UpdateError: No banner detected at all.
             UpdateError: Any non-success banners raise an error with the banner text.
-        """        
+        """
+        try:
+            payload = self._read_banner(timeout)
+        except WebDriverException as e:
+            self.debug_logger.debug(f'Unable to wait for the banner with a script. Checking the banner element. {e}')
+            return self._wait_for_banner_element(timeout, ignore_exception)
+        if not payload.get('found'):
+            if ignore_exception:
+                return None
+            raise UpdateError('No banner detected.')
+        banner_type = BANNER_CLASSES.get(payload['match'])
+        if not banner_type:
+            if ignore_exception:
+                return None
+            raise UpdateError(f'Unexpected banner type detected. Found {payload["banner_class"]}. Expected one of {list(BANNER_CLASSES.keys())}')
+        if banner_type != BANNER_SUCCESS:
+            raise UpdateError(payload['text'], **payload['errors'])
+
+
+    def _wait_for_banner_element(self, timeout:int=10, ignore_exception:bool=False) -> None:
         try:
             loop = 0
             while loop <= timeout:
@@ -98,9 +354,15 @@ class UXDriver(PlexDriver):
             raise UpdateError(banner_text, **error_fields)
     
 
+    @instrumented
     def wait_for_gears(self, loading_timeout=10) -> None:
         super().wait_for_gears(PLEX_GEARS_SELECTOR, loading_timeout)
 
+
+    def wait_for_page_ready(self, timeout:float=10, quiet_period:float=0.1, poll_frequency:float=0.05, activity_timeout:float=0) -> bool:
+        return super().wait_for_page_ready(PLEX_GEARS_SELECTOR, timeout=timeout, quiet_period=quiet_period, poll_frequency=poll_frequency, activity_timeout=activity_timeout)
+
+    @instrumented
     def click_button(self, button_text:str, driver:Union['UXDriver','UXPlexElement']=None) -> None:
         """Clicks a standard button with matching text.
 
@@ -125,13 +387,16 @@ class UXDriver(PlexDriver):
                 
         """
         driver = driver or self.driver
-        buttons = driver.find_elements(By.TAG_NAME, 'button')
-        for b in buttons:
-            if b.get_property('textContent') == button_text:
-                self.debug_logger.debug(f'Button found with matching text: {button_text}')
-                b.click()
-                break
+        try:
+            button = self.find_element_by_text([(By.TAG_NAME, 'button')], button_text, driver=driver)
+        except WebDriverException as e:
+            self.debug_logger.debug(f'Unable to match buttons with a script. Checking each button. {e}')
+            button = next((b for b in driver.find_elements(By.TAG_NAME, 'button') if b.get_property('textContent') == button_text), None)
+        if button:
+            self.debug_logger.debug(f'Button found with matching text: {button_text}')
+            button.click()
             
+    @instrumented
     def click_action_bar_item(self, item:str, sub_item:str=None) -> None:
         """Clicks on an action bar item.
 
@@ -168,26 +433,50 @@ class UXDriver(PlexDriver):
 
     def _click_sub_item(self, action_bar, item, sub_item):
         """Helper function to click on a sub-item."""
-        action_items = action_bar.find_elements(By.CLASS_NAME, "plex-actions-has-more")
-        for a in action_items:
-            span_texts = a.find_elements(By.TAG_NAME, 'span')
-            for s in span_texts:
-                if s.get_property('textContent') == item:
-                    s.find_element(By.XPATH, "ancestor::a").click()
-                    break
+        try:
+            item_link = self.find_element_by_text([(By.CSS_SELECTOR, '.plex-actions-has-more span')], item, driver=action_bar, closest='a')
+            if item_link:
+                item_link.click()
+        except WebDriverException as e:
+            self.debug_logger.debug(f'Unable to match action items with a script. Checking each item. {e}')
+            action_items = action_bar.find_elements(By.CLASS_NAME, "plex-actions-has-more")
+            for a in action_items:
+                span_texts = a.find_elements(By.TAG_NAME, 'span')
+                for s in span_texts:
+                    if s.get_property('textContent') == item:
+                        s.find_element(By.XPATH, "ancestor::a").click()
+                        break
         action_bar.find_element(By.LINK_TEXT, sub_item).click()
 
 
+    @instrumented
     def login(self, username, password, company_code, pcn, test_db=True, headless=False):
         self._set_login_vars()
         super().login(username, password, company_code, pcn, test_db, headless)
-        self._login_validate()
-        self.pcn_switch(self.pcn)
+        if not self.session_restored:
+            self._login_validate()
+            self.pcn_switch(self.pcn)
         self.token = self.token_get()
         self.first_login = False
+        self.save_session()
         return (self.driver, self.url_comb, self.token)
     
     
+    def data_source(self, headers:dict=None) -> 'UXSessionDataSource':
+        """Create a data source client that uses this driver's session.
+
+        Data sources are called over HTTP with the browser cookies and token instead of web service credentials.
+
+        Args:
+            headers (dict, optional): Additional request headers. Defaults to None.
+
+        Returns:
+            UXSessionDataSource: data source client for the current session.
+        """
+        from pmc_automation_tools.api.ux.datasource import UXSessionDataSource
+        return UXSessionDataSource(self, headers=headers)
+
+
     def _set_login_vars(self):
         self.plex_main = 'cloud.plex.com'
         self.plex_prod = ''
@@ -215,6 +504,7 @@ class UXDriver(PlexDriver):
             self.first_login = False
             return
         self.url_token = self.token_get()
+        self._picker_cache.clear()
         self.driver.get(f'{self.url_comb}/SignOn/Customer/{pcn}?{self.url_token}')
         if UX_INVALID_PCN_MESSAGE in self.driver.current_url.upper():
             raise LoginError(self.environment, self.db, pcn, f'Unable to login to PCN. Verify you have access.')
@@ -226,6 +516,56 @@ class UXDriver(PlexDriver):
             raise LoginError(self.environment, self.db, self.pcn_name, 'Login page not detected. Please validate login credentials and try again.')
         
     
+    def _grid_key(self, grid) -> tuple:
+        # Column layouts are cached per screen. Every screen has the same path and is identified by __actionKey.
+        # The other query parameters are the session token and filters.
+        url = urlsplit(self.driver.current_url)
+        action_key = parse_qs(url.query).get('__actionKey', [None])[0]
+        return (url.path, action_key, getattr(grid, 'id', None))
+
+
+    def grid_columns(self, grid:'UXPlexElement'=None, refresh:bool=False) -> list[Union[str, None]]:
+        """Column titles of a grid by column index.
+
+        The titles are cached per screen and grid.
+
+        Args:
+            grid (UXPlexElement, optional): element containing the grid. Defaults to the first grid on the page.
+            refresh (bool, optional): Read the titles again instead of using the cached titles. Defaults to False.
+
+        Returns:
+            list[str|None]: column titles. None for columns without a title.
+        """
+        key = self._grid_key(grid)
+        if refresh or key not in self._grid_columns:
+            self._grid_columns[key] = self.driver.execute_script(GRID_COLUMNS_SCRIPT, grid) or []
+        return self._grid_columns[key]
+
+
+    @instrumented
+    def read_grid(self, grid:'UXPlexElement'=None, scroll:bool=False, scroll_delay:float=0.2, max_scrolls:int=200) -> UXGrid:
+        """Read the headers, cell text, hyperlinks and row data attributes of a grid in a single script call.
+
+        Args:
+            grid (UXPlexElement, optional): element containing the grid. Defaults to the first grid on the page.
+            scroll (bool, optional): Scroll through the grid to collect rows that are only rendered when visible. 
+                Rows still rendered after a scroll are only returned once. They are identified by their row index or data attributes, or by their content if they have neither. Defaults to False.
+            scroll_delay (float, optional): Seconds to wait for rows to render after each scroll. Defaults to 0.2.
+            max_scrolls (int, optional): Maximum number of scroll steps. Defaults to 200.
+
+        Returns:
+            UXGrid: grid snapshot.
+        """
+        if scroll:
+            # Every scroll step waits scroll_delay. The margin covers rendering and reading the rows.
+            self._ensure_script_timeout(max_scrolls * scroll_delay + 30)
+        headers, rows = self.driver.execute_async_script(GRID_ROWS_SCRIPT, grid, scroll, int(scroll_delay * 1000), max_scrolls)
+        # The titles are read with the rows. Keep them for highlight_row.
+        headers = self._grid_columns[self._grid_key(grid)] = headers or []
+        return UXGrid(headers, rows)
+
+
+    @instrumented
     def highlight_row(self, value:str, column:Union[str|int], row_offset:int=0):
         """
         Clicks a row in a grid with a matching value in the column provided.
@@ -235,38 +575,122 @@ class UXDriver(PlexDriver):
             column (str|int): the column name or index of the column that should be used for matching
             row_offset(int): if there are multiple matching rows, the offset can be used to indicate which of them should be highlighted.
         """
-        column_match = None
         if isinstance(column, str):
-            # There are usually two thead elements for any given grid. However, they should both work for finding the proper column index for a given column title.
-            _plex_grid_header = self.driver.find_element(By.TAG_NAME, 'thead')
-            _header_cells = _plex_grid_header.find_elements(By.CLASS_NAME, 'plex-grid-header-cell')
-            for i, h in enumerate(_header_cells):
-                abbr = h.find_elements(By.TAG_NAME, 'abbr')
-                if len(abbr) > 0:
-                    if abbr[0].get_attribute('textContent') == column:
-                        column_match = i
-                        break
-            if column_match is None:
-                raise GridColumnError(f'No column detected in the table matching provided value: {column}.')
-            column = column_match
-        rows = self.driver.find_elements(By.XPATH, f"//tr[contains(@class,'plex-grid-row selectable')]/td[@data-col-index={column}]")
-        matching_rows = []
-        for r in rows:
-            if r.get_property('textContent') == value:
-                matching_rows.append(r)
+            title = column
+            headers = self.grid_columns()
+            try:
+                column = UXGrid(headers, []).column_index(title)
+            except GridColumnError:
+                # The cached columns may be from before the grid was changed.
+                headers = self.grid_columns(refresh=True)
+                column = UXGrid(headers, []).column_index(title)
+            matching_rows = self.driver.execute_script(GRID_MATCH_ROWS_SCRIPT, None, column, value, headers)
+            if matching_rows is None:
+                # The live titles don't match the cached titles.
+                headers = self.grid_columns(refresh=True)
+                column = UXGrid(headers, []).column_index(title)
+                matching_rows = self.driver.execute_script(GRID_MATCH_ROWS_SCRIPT, None, column, value, headers)
+        else:
+            matching_rows = self.driver.execute_script(GRID_MATCH_ROWS_SCRIPT, None, column, value, None)
         if len(matching_rows) == 0:
             raise GridRowError(f"Plex grid row not found for column index {column} containing value: {value}.")
         if len(matching_rows) > 1:
             print(f"Multiple rows match the provided text content. Selecting row number {row_offset} from these results.")
-        matching_rows[row_offset].find_element(By.XPATH, '..').click() # Click the TR element to avoid clicking a hyperlink in the TD
+        matching_rows[row_offset].click() # Click the TR element to avoid clicking a hyperlink in the TD
         return None
 
 
+    @instrumented
+    def sync_form(self, values:dict[str, Any], root:'UXPlexElement'=None, pickers:tuple[str, ...]=(), clear:bool=False) -> dict[str, tuple]:
+        """Sync many form fields by name, only changing the fields that don't already match.
+
+        All current values are read with one script call.
+        Text boxes, checkboxes and selection lists are changed with one more script call that fires the input and change events.
+        Popup and date pickers are synced with sync_picker.
+
+        Args:
+            values (dict[str, Any]): Desired value for each field name.
+            root (UXPlexElement, optional): Element containing the fields. e.g. a popup form. Defaults to None.
+            pickers (tuple[str, ...], optional): Field names to treat as pickers if they aren't detected from an existing selection. Defaults to ().
+            clear (bool, optional): Clear fields when the desired value is blank. Defaults to False.
+
+        Raises:
+            NoSuchElementException: A field name was not found.
+            NoRecordError: A selection list doesn't have an option matching the value.
+
+        Returns:
+            dict[str, tuple]: Changed field names with the original and new values.
+        """
+        values = {name: value for name, value in values.items() if clear or value not in (None, '')}
+        if not values:
+            return {}
+        try:
+            fields = self.driver.execute_script(FORM_READ_SCRIPT, root, list(values), list(pickers))
+        except WebDriverException as e:
+            self.debug_logger.debug(f'Unable to read the form with a script. Syncing each field. {e}')
+            return self._sync_form_elements(values, root, pickers, clear)
+        missing = [name for name, field in fields.items() if field is None]
+        if missing:
+            raise NoSuchElementException(f'Form fields not found: {missing}')
+        changes = {}
+        updates = []
+        picker_updates = []
+        for name, value in values.items():
+            field = fields[name]
+            kind = field['kind']
+            if kind == 'checkbox':
+                value = value if isinstance(value, bool) else bool(int(value))
+            elif kind == 'select':
+                value = ' '.join(str(value).split())
+            else:
+                value = '' if value is None else str(value).replace('\t', ' ')
+            if field['value'] == value:
+                continue
+            changes[name] = (field['value'], value)
+            if kind == 'picker':
+                picker_updates.append((UXPlexElement(field['element'], self), value))
+            else:
+                updates.append([name, field['element'], kind, value])
+        if updates:
+            self.debug_logger.info(f'Updating form fields: {[u[0] for u in updates]}')
+            not_found = self.driver.execute_script(FORM_APPLY_SCRIPT, updates)
+            if not_found:
+                raise NoRecordError(f'No matching selection available for {not_found}')
+        for element, value in picker_updates:
+            element.sync_picker(value, clear=clear)
+        return changes
+
+
+    def _sync_form_elements(self, values:dict[str, Any], root:'UXPlexElement'=None, pickers:tuple[str, ...]=(), clear:bool=False) -> dict[str, tuple]:
+        changes = {}
+        for name, value in values.items():
+            element = self.wait_for_element((By.NAME, name), driver=root)
+            if name in pickers or element.tag_name == 'select':
+                element.sync_picker(str(value), clear=clear)
+            elif element.get_attribute('type') in ('checkbox', 'radio'):
+                checked = element.get_property('checked')
+                element.sync_checkbox(value)
+                if checked != element.get_property('checked'):
+                    changes[name] = (checked, not checked)
+            else:
+                original = element.sync_textbox('' if value is None else str(value), clear=clear)
+                if original is not None:
+                    changes[name] = (original, value)
+        return changes
+
+
 class UXPlexElement(PlexElement):
     def __init__(self, webelement, parent):
         super().__init__(webelement, parent)
 
 
+    def sync_form(self, values:dict[str, Any], pickers:tuple[str, ...]=(), clear:bool=False) -> dict[str, tuple]:
+        """Sync many form fields within this element. See UXDriver.sync_form.
+        """
+        return self._plex_driver.sync_form(values, root=self, pickers=pickers, clear=clear)
+
+
+    @instrumented
     def sync_picker(self, text_content:str, clear:bool=False, date:bool=False, column_delimiter:str='\t') -> None:
         """Sync the picker element to the provided value.
 
@@ -306,6 +730,25 @@ class UXPlexElement(PlexElement):
         # I don't think there should ever by any tab or newline characters within these options, but this would normalize them as well.
         # This action shouldn't be performed for non-select type pickers since the initial search uses exact database values retaining sequencial spaces.
         text_content = ' '.join(text_content.split())
+        try:
+            current_selection, option = self.driver.execute_script(SELECT_OPTION_SCRIPT, self, text_content)
+        except WebDriverException as e:
+            self.debug_logger.debug(f'Unable to match options with a script. Checking each option. {e}')
+            self._handle_select_picker_options(text_content)
+            return
+        if current_selection == text_content:
+            self.debug_logger.debug(f'Picker selection: {current_selection} matches {text_content}')
+            return
+        if option:
+            self.debug_logger.info(f'Matching option found. Picking {text_content}')
+            option.click()
+            self.send_keys(Keys.TAB)
+        else:
+            self.debug_logger.info(f'No matching selection available for {text_content}')
+            raise NoRecordError(f'No matching selection available for {text_content}')
+
+
+    def _handle_select_picker_options(self, text_content):
         _select = Select(self)
         current_selection = _select.first_selected_option.text
         if current_selection == text_content:
@@ -363,12 +806,48 @@ class UXPlexElement(PlexElement):
     
 
     def _handle_popup_or_picker(self, text_content, date, column_delimiter):
-        try:
-            picker_xpath = "preceding-sibling::div[@class='plex-picker-item']" if date else "preceding-sibling::div[@class='plex-picker-selected-items']"
-            self.wait_for_element((By.XPATH, picker_xpath), driver=self, timeout=5)
+        cache = self._plex_driver._picker_cache
+        key = (self.get_attribute('name'), text_content)
+        cached = cache.get(key)
+        if cached == 'popup':
+            self.debug_logger.debug(f'{text_content} was previously selected from a popup window.')
+            if self.wait_for_element((By.CLASS_NAME, 'modal-dialog.plex-picker'), timeout=3, ignore_exception=True):
+                self._handle_popup_window(text_content, column_delimiter)
+                return
+            # The value may now fill in the picker directly.
+            self.debug_logger.debug(f'No popup window opened for {text_content}.')
+            del cache[key]
+            result = self._wait_for_picker_result(date, timeout=1)
+        elif cached == 'direct':
+            result = self._wait_for_picker_result(date, timeout=1)
+            if result != 'direct':
+                del cache[key]
+        else:
+            result = None
+        if result is None:
+            result = self._wait_for_picker_result(date)
+        if result == 'direct':
             self.debug_logger.info(f'Picker has been filled in with {text_content}')
-        except (TimeoutException, NoSuchElementException):
-            self._handle_popup_window(text_content, column_delimiter)
+            cache[key] = 'direct'
+            return
+        self._handle_popup_window(text_content, column_delimiter)
+        cache[key] = 'popup'
+
+
+    def _wait_for_picker_result(self, date, timeout=5) -> Union[str, None]:
+        # Returns as soon as either the picker is filled in or a popup window opens instead of waiting for the picker to time out.
+        picker_xpath = "preceding-sibling::div[@class='plex-picker-item']" if date else "preceding-sibling::div[@class='plex-picker-selected-items']"
+        def result(driver):
+            if any(e.is_displayed() for e in self.find_elements(By.XPATH, picker_xpath)):
+                return 'direct'
+            if any(e.is_displayed() for e in driver.find_elements(By.CSS_SELECTOR, '.modal-dialog.plex-picker')):
+                return 'popup'
+            return False
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=self._plex_driver.poll_frequency,
+                                 ignored_exceptions=(StaleElementReferenceException,)).until(result)
+        except TimeoutException:
+            return None
 
 
     def _handle_popup_window(self, text_content, column_delimiter):
@@ -378,12 +857,22 @@ class UXPlexElement(PlexElement):
             multi = 'plex-picker-multi' in popup.get_attribute('class')
             self.wait_for_gears()
 
-            items = popup.find_elements(By.CLASS_NAME, 'plex-grid-row')
-            if not items:
-                self._handle_no_records_popup(popup, text_content)
-            
-            option_found = self._find_and_click_option(items, text_content, column_delimiter)
-            
+            try:
+                item, row_count = self.driver.execute_script(POPUP_MATCH_SCRIPT, popup, text_content, column_delimiter)
+            except WebDriverException as e:
+                self.debug_logger.debug(f'Unable to match popup rows with a script. Checking each row. {e}')
+                items = popup.find_elements(By.CLASS_NAME, 'plex-grid-row')
+                if not items:
+                    self._handle_no_records_popup(popup, text_content)
+                option_found = self._find_and_click_option(items, text_content, column_delimiter)
+            else:
+                if not row_count:
+                    self._handle_no_records_popup(popup, text_content)
+                option_found = item is not None
+                if option_found:
+                    self.debug_logger.info(f'Found matching item with text {text_content}.')
+                    item.click()
+
             if not option_found:
                 raise NoSuchElementException(f'No matching elements found for {text_content}')
             if multi:
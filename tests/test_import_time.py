@@ -0,0 +1,37 @@
+import json
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Seconds allowed for importing the package and the API input classes in a new interpreter.
+# The API-only path imports requests. Selenium, openpyxl, tkinter or pytz would add several times this.
+IMPORT_BUDGET = 1.0
+HEAVY_MODULES = ('selenium', 'openpyxl', 'tkinter', 'pytz')
+IMPORT_SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+import pmc_automation_tools
+from pmc_automation_tools import DataSourceInput
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+'''
+
+
+def _run_import() -> dict:
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    result = subprocess.run([sys.executable, '-c', IMPORT_SCRIPT], capture_output=True, text=True, env=env, cwd=ROOT, check=True)
+    return json.loads(result.stdout)
+
+
+def test_api_import_skips_heavy_dependencies():
+    modules = _run_import()['modules']
+    loaded = [name for name in HEAVY_MODULES if name in modules]
+    assert not loaded, f'Importing the package loaded {loaded}.'
+
+
+def test_api_import_time_budget():
+    # Best of three runs so a busy machine doesn't fail the test.
+    elapsed = min(_run_import()['elapsed'] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET, f'Importing the package took {elapsed:.3f}s. The budget is {IMPORT_BUDGET}s.'